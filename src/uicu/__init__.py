@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 from __future__ import annotations
 
+from collections import Counter
+
 # Version information
 try:
     from uicu._version import __version__  # type: ignore
@@ -32,14 +34,16 @@ from uicu.exceptions import (
     OperationError,
     UICUError,
 )
-from uicu.locale import Locale, get_available_locales, get_default_locale
+from uicu.locale import Locale, get_available_locales, get_default_locale, is_locale_available
 from uicu.segment import (
     # Classes
     GraphemeSegmenter,
     LineSegmenter,
+    PreparedText,
     SentenceSegmenter,
     WordSegmenter,
     # Functions
+    contains_word,
     graphemes,
     line_breaks,
     lines,
@@ -86,19 +90,19 @@ def detect_script(text: str) -> str | None:
         if not HAS_FONTTOOLS or get_script is None:
             return None
 
-        # Count scripts used
-        script_counts = {}
-        for char in text:
+        # Count scripts used, looking up each distinct character once
+        script_counts: Counter[str] = Counter()
+        for char, count in Counter(text).items():
             if char.isalpha():  # Only count alphabetic characters
                 s = get_script(char)
                 if s not in ("Zyyy", "Zinh", "Zzzz"):  # Ignore common/inherited/unknown
-                    script_counts[s] = script_counts.get(s, 0) + 1
+                    script_counts[s] += count
 
         if not script_counts:
             return None
 
         # Return most common script
-        return max(script_counts.items(), key=lambda x: x[1])[0]
+        return script_counts.most_common(1)[0][0]
     except Exception:
         return None
 
@@ -123,6 +127,7 @@ __all__ = [
     "LineSegmenter",
     "Locale",
     "OperationError",
+    "PreparedText",
     "SegmentationError",
     "SentenceSegmenter",
     "TransliterationError",
@@ -135,6 +140,7 @@ __all__ = [
     "category",
     "combining",
     "compare",
+    "contains_word",
     "decimal",
     "detect_script",
     "digit",
@@ -143,6 +149,7 @@ __all__ = [
     "get_available_transforms",
     "get_default_locale",
     "graphemes",
+    "is_locale_available",
     "line_breaks",
     "lines",
     "mirrored",
@@ -2,11 +2,12 @@
 from __future__ import annotations
 
 from functools import lru_cache
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import icu
 
 if TYPE_CHECKING:
+    from uicu.collate import Collator
     from uicu.locale import Locale
 
 # this_file: src/uicu/_utils.py
@@ -29,14 +30,26 @@ def ensure_locale(locale: str | Locale) -> Locale:
     Raises:
         ICU errors if locale string is invalid.
     """
-    # Use duck typing instead of isinstance to avoid circular imports
-    if hasattr(locale, "language_tag"):
-        return locale  # Already a Locale object
+    # Locale objects are immutable, so share one per tag string
+    if isinstance(locale, str):
+        return _get_cached_locale(locale)
 
-    # Import here is safe since we're in a utility module
+    return locale  # Already a Locale object
+
+
+@lru_cache(maxsize=64)
+def _get_cached_locale(language_tag: str) -> Locale:
+    """Cache Locale construction for repeatedly used tag strings.
+
+    Args:
+        language_tag: BCP 47 language tag string
+
+    Returns:
+        Cached Locale instance
+    """
     from uicu.locale import Locale
 
-    return Locale(locale)
+    return Locale(language_tag)
 
 
 # Performance optimization: Cache expensive ICU object creation
@@ -65,17 +78,34 @@ def _get_cached_collator(locale_id: str, strength: int, numeric: bool, case_leve
     return collator
 
 
-@lru_cache(maxsize=64)
-def _get_cached_transliterator(transform_id: str) -> icu.Transliterator:
+@lru_cache(maxsize=128)
+def _get_cached_uicu_collator(locale_id: str, options: tuple[tuple[str, Any], ...]) -> Collator:
+    """Cache Collator wrappers shared by the collation convenience functions.
+
+    Args:
+        locale_id: Full ICU locale ID, including keywords such as collation=phonebook
+        options: Sorted (name, value) pairs of Collator keyword arguments
+
+    Returns:
+        Cached Collator instance
+    """
+    from uicu.collate import Collator
+
+    return Collator(locale_id, **dict(options))
+
+
+@lru_cache(maxsize=128)
+def _get_cached_transliterator(transform_id: str, direction: int = icu.UTransDirection.FORWARD) -> icu.Transliterator:
     """Cache expensive ICU transliterator creation.
     
     Args:
         transform_id: Transliterator ID string
+        direction: ICU UTransDirection constant
         
     Returns:
         Cached ICU Transliterator instance
     """
-    return icu.Transliterator.createInstance(transform_id)
+    return icu.Transliterator.createInstance(transform_id, direction)
 
 
 @lru_cache(maxsize=64)
@@ -101,3 +131,44 @@ def _get_cached_break_iterator(locale_id: str, iterator_type: str) -> icu.BreakI
         return icu.BreakIterator.createLineInstance(locale)
     else:
         raise ValueError(f"Unknown iterator type: {iterator_type}")
+
+
+@lru_cache(maxsize=32)
+def _get_cached_pattern_generator(locale_id: str) -> icu.DateTimePatternGenerator:
+    """Cache expensive ICU date/time pattern generator creation.
+
+    Args:
+        locale_id: Locale identifier string
+
+    Returns:
+        Cached ICU DateTimePatternGenerator instance
+    """
+    return icu.DateTimePatternGenerator.createInstance(icu.Locale(locale_id))
+
+
+@lru_cache(maxsize=256)
+def _get_cached_best_pattern(locale_id: str, skeleton: str) -> str:
+    """Cache the best date/time pattern for a skeleton.
+
+    Args:
+        locale_id: Locale identifier string
+        skeleton: Date/time skeleton (e.g., 'yMMMd')
+
+    Returns:
+        Locale-specific pattern string
+    """
+    return _get_cached_pattern_generator(locale_id).getBestPattern(skeleton)
+
+
+@lru_cache(maxsize=256)
+def _get_cached_skeleton(locale_id: str, pattern: str) -> str:
+    """Cache the skeleton derived from a date/time pattern.
+
+    Args:
+        locale_id: Locale identifier string
+        pattern: Date/time pattern (e.g., 'MMM d, y')
+
+    Returns:
+        Skeleton string
+    """
+    return _get_cached_pattern_generator(locale_id).getSkeleton(pattern)
@@ -1,11 +1,12 @@
 #!/usr/bin/env python
 from __future__ import annotations
 
+from operator import itemgetter
 from typing import TYPE_CHECKING
 
 import icu
 
-from uicu._utils import ensure_locale
+from uicu._utils import _get_cached_uicu_collator, ensure_locale
 from uicu.exceptions import ConfigurationError
 
 if TYPE_CHECKING:
@@ -94,21 +95,21 @@ class Collator:
         self._locale = locale
         self._strength = strength
         self._numeric = numeric
+        self._case_first = case_first
+        self._case_level = case_level
 
     def compare(self, a: str, b: str) -> int:
         """Compare two strings according to collation rules.
 
         Returns -1 if a < b, 0 if a == b, 1 if a > b.
         """
-        result = self._collator.compare(a, b)
-        # Normalize to -1, 0, 1
-        if result < 0:
-            return -1
-        if result > 0:
-            return 1
-        return 0
-
-    def key(self, s: str) -> bytes:
+        if a == b:
+            # Identical strings are equal at every strength; skip ICU
+            return 0
+        # ICU's UCollationResult is already exactly -1, 0 or 1
+        return self._collator.compare(a, b)
+
+    def key(self, s: str, max_strength: str | None = None) -> bytes:
         """Return sort key for string.
 
         The sort key is a byte sequence that, when compared using
@@ -117,12 +118,69 @@ class Collator:
 
         Args:
             s: String to create sort key for.
+            max_strength: Optionally drop the key's levels above this strength
+                         (e.g. 'primary'), giving a shorter key for storage.
+                         Trimmed keys only order consistently with other keys
+                         trimmed to the same strength.
 
         Returns:
             Sort key as bytes.
+
+        Raises:
+            ConfigurationError: If max_strength is not a valid strength name.
         """
-        # getSortKey returns bytes directly in PyICU
-        return self._collator.getSortKey(s)
+        if max_strength is None:
+            # getSortKey returns bytes directly in PyICU
+            return self._collator.getSortKey(s)
+
+        try:
+            requested = STRENGTH_MAP[max_strength]
+        except KeyError:
+            msg = f"Invalid strength '{max_strength}'. Must be one of: {', '.join(STRENGTH_MAP.keys())}"
+            raise ConfigurationError(msg) from None
+        if requested >= STRENGTH_MAP[self._strength]:
+            return self._collator.getSortKey(s)
+
+        if self._case_level:
+            # ICU keeps the case level at every strength, after the secondary
+            # level, and its content depends on the strength, so it cannot be
+            # cut out of this key; use a collator at the requested strength
+            options = (
+                ("case_first", self._case_first),
+                ("case_level", True),
+                ("numeric", self._numeric),
+                ("strength", max_strength),
+            )
+            return _get_cached_uicu_collator(self._locale._icu_locale.getName(), options).key(s)
+
+        key = self._collator.getSortKey(s)
+
+        # Count the levels to keep, in the order ICU writes them
+        levels = 1
+        if requested >= icu.Collator.SECONDARY:
+            levels += 1
+        if requested >= icu.Collator.TERTIARY:
+            levels += 1
+        if requested >= icu.Collator.QUATERNARY:
+            levels += 1
+
+        # Levels are separated by 0x01 and the key is terminated by 0x00
+        end = -1
+        for _ in range(levels):
+            end = key.index(b"\x01", end + 1)
+        return key[:end] + b"\x00"
+
+    def keys(self, strings: Iterable[str]) -> list[bytes]:
+        """Return sort keys for many strings at once.
+
+        Args:
+            strings: Iterable of strings to create sort keys for.
+
+        Returns:
+            List of sort keys, in the same order as the input.
+        """
+        # map() drives ICU directly, without a Python frame per string
+        return list(map(self._collator.getSortKey, strings))
 
     def __call__(self, s: str) -> bytes:
         """Make collator callable as a key function.
@@ -147,7 +205,23 @@ class Collator:
         Returns:
             New list with strings sorted according to collation rules.
         """
-        return sorted(strings, key=self.key)
+        # Each sort key is computed once; the sort itself compares bytes
+        return sorted(strings, key=self._collator.getSortKey)
+
+    def sort_with_keys(self, strings: Iterable[str]) -> list[tuple[bytes, str]]:
+        """Return strings sorted together with their sort keys.
+
+        Useful when the keys will be kept, e.g. for merging further
+        strings into an already sorted sequence with bisect.
+
+        Args:
+            strings: Iterable of strings to sort.
+
+        Returns:
+            New list of (sort key, string) pairs in collation order.
+        """
+        get_key = self._collator.getSortKey
+        return sorted([(get_key(s), s) for s in strings], key=itemgetter(0))
 
     def is_equal(self, a: str, b: str) -> bool:
         """Check if two strings are equal according to collation rules.
@@ -159,7 +233,8 @@ class Collator:
         Returns:
             True if strings are considered equal.
         """
-        return self.compare(a, b) == 0
+        # Identical strings are equal at every strength; skip ICU
+        return a == b or self._collator.equals(a, b)
 
     def is_less(self, a: str, b: str) -> bool:
         """Check if first string is less than second.
@@ -171,7 +246,7 @@ class Collator:
         Returns:
             True if a < b according to collation rules.
         """
-        return self.compare(a, b) < 0
+        return self._collator.greater(b, a)
 
     def is_greater(self, a: str, b: str) -> bool:
         """Check if first string is greater than second.
@@ -183,7 +258,7 @@ class Collator:
         Returns:
             True if a > b according to collation rules.
         """
-        return self.compare(a, b) > 0
+        return self._collator.greater(a, b)
 
     @property
     def locale(self) -> Locale:
@@ -208,11 +283,30 @@ class Collator:
 # Convenience functions
 
 
+def _get_collator(locale: str | Locale, options: dict[str, object]) -> Collator:
+    """Return a shared Collator for the convenience functions.
+
+    Collator exposes no setters, so one instance can safely serve every
+    call with the same locale and options.
+
+    Raises:
+        ConfigurationError: If an option value is not hashable.
+    """
+    key = tuple(sorted(options.items()))
+    try:
+        hash(key)
+    except TypeError as e:
+        msg = f"Collator options must be hashable: {e}"
+        raise ConfigurationError(msg) from e
+    # Locale objects compare by base name only, so key on the full ID to keep keywords
+    return _get_cached_uicu_collator(ensure_locale(locale)._icu_locale.getName(), key)
+
+
 def sort(strings: Iterable[str], locale: str | Locale, **options) -> list[str]:
     """Sort strings according to locale rules.
 
-    This is a convenience function that creates a temporary collator
-    for one-off sorting operations.
+    This is a convenience function for one-off sorting operations. The
+    collator is cached across calls with the same locale and options.
 
     Args:
         strings: Iterable of strings to sort.
@@ -226,15 +320,15 @@ def sort(strings: Iterable[str], locale: str | Locale, **options) -> list[str]:
         >>> sort(['café', 'cote', 'côte', 'coté'], 'fr-FR')
         ['café', 'cote', 'coté', 'côte']
     """
-    collator = Collator(locale, **options)
+    collator = _get_collator(locale, options)
     return collator.sort(strings)
 
 
 def compare(a: str, b: str, locale: str | Locale, **options) -> int:
     """Compare two strings according to locale rules.
 
-    This is a convenience function that creates a temporary collator
-    for one-off comparisons.
+    This is a convenience function for one-off comparisons. The
+    collator is cached across calls with the same locale and options.
 
     Args:
         a: First string.
@@ -245,5 +339,5 @@ def compare(a: str, b: str, locale: str | Locale, **options) -> int:
     Returns:
         -1 if a < b, 0 if a == b, 1 if a > b.
     """
-    collator = Collator(locale, **options)
+    collator = _get_collator(locale, options)
     return collator.compare(a, b)
@@ -1,15 +1,20 @@
 #!/usr/bin/env python
 from __future__ import annotations
 
+from datetime import datetime, timedelta, timezone, tzinfo
 from typing import TYPE_CHECKING
 
 import icu
 
-from uicu._utils import ensure_locale
+from uicu._utils import (
+    _get_cached_best_pattern,
+    _get_cached_skeleton,
+    ensure_locale,
+)
 from uicu.exceptions import OperationError
 
 if TYPE_CHECKING:
-    from datetime import datetime, tzinfo
+    from collections.abc import Iterable
 
     from uicu.locale import Locale
 
@@ -21,6 +26,33 @@ enabling locale-sensitive formatting of dates, times, numbers, currencies,
 lists, and complex messages.
 """
 
+# Map string style names to ICU constants
+STYLE_MAP = {
+    "full": icu.DateFormat.kFull,
+    "long": icu.DateFormat.kLong,
+    "medium": icu.DateFormat.kMedium,
+    "short": icu.DateFormat.kShort,
+    "none": icu.DateFormat.kNone,
+}
+
+# ICU separates interval endpoints with thin spaces around an en dash; only
+# that separator is rewritten, see format_range()
+_RANGE_TRANSLATION = str.maketrans({"\u2009": " ", "\u2013": "-"})
+
+# GregorianCalendar switches to Julian rules before 1582-10-15; stay clear of it
+_GREGORIAN_CUTOVER_YEAR = 1582
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MILLISECOND = timedelta(milliseconds=1)
+
+
+def _utc_udate(dt: datetime) -> float:
+    """Convert the wall-clock fields of a datetime to an ICU UDate, read as UTC.
+
+    Uses datetime's own C-level arithmetic instead of a Calendar round trip.
+    """
+    # PyICU represents UDate as seconds since the epoch, at millisecond precision
+    return ((dt.replace(tzinfo=timezone.utc) - _EPOCH) // _MILLISECOND) / 1000
+
 
 class DateTimeFormatter:
     """Formats datetime objects according to locale conventions.
@@ -62,41 +94,49 @@ class DateTimeFormatter:
         self._pattern = pattern
         self._skeleton = skeleton
 
+        locale_id = locale._icu_locale.getName()
+
         # Create formatter based on provided options
         if pattern:
             # Use custom pattern
             self._formatter = icu.SimpleDateFormat(pattern, locale._icu_locale)
         elif skeleton:
             # Use skeleton pattern with pattern generator
-            pg = icu.DateTimePatternGenerator.createInstance(locale._icu_locale)
-            best_pattern = pg.getBestPattern(skeleton)
+            best_pattern = _get_cached_best_pattern(locale_id, skeleton)
             self._formatter = icu.SimpleDateFormat(best_pattern, locale._icu_locale)
         else:
             # Use style-based formatter
-            style_map = {
-                "full": icu.DateFormat.kFull,
-                "long": icu.DateFormat.kLong,
-                "medium": icu.DateFormat.kMedium,
-                "short": icu.DateFormat.kShort,
-                "none": -1,
-            }
-
-            date_style_val = style_map.get(date_style)
-            time_style_val = style_map.get(time_style)
-
-            if date_style_val is None:
-                msg = f"Invalid date_style '{date_style}'. Must be one of: full, long, medium, short, none"
-                raise OperationError(msg)
-            if time_style_val is None:
-                msg = f"Invalid time_style '{time_style}'. Must be one of: full, long, medium, short, none"
-                raise OperationError(msg)
+            try:
+                date_style_val = STYLE_MAP[date_style]
+            except KeyError:
+                msg = f"Invalid date_style '{date_style}'. Must be one of: {', '.join(STYLE_MAP)}"
+                raise OperationError(msg) from None
+            try:
+                time_style_val = STYLE_MAP[time_style]
+            except KeyError:
+                msg = f"Invalid time_style '{time_style}'. Must be one of: {', '.join(STYLE_MAP)}"
+                raise OperationError(msg) from None
 
             self._formatter = icu.DateFormat.createDateTimeInstance(date_style_val, time_style_val, locale._icu_locale)
 
+        # ICU zones resolved from datetime tzinfo, see _resolve_tzinfo()
+        self._tzinfo_cache: dict[str | None, tuple[icu.TimeZone, bool]] = {}
+
         # Set timezone if provided
         if tz:
             self._set_timezone(tz)
 
+        # Interval formatting needs a skeleton; derive one from the style's pattern
+        # if needed. An explicit pattern is kept verbatim, so ranges then format
+        # each endpoint with it instead.
+        self._interval_skeleton = None
+        if not pattern:
+            self._interval_skeleton = skeleton
+            if not skeleton and isinstance(self._formatter, icu.SimpleDateFormat):
+                self._interval_skeleton = _get_cached_skeleton(locale_id, self._formatter.toPattern())
+        # Built on first use
+        self._interval_formatter = None
+
     def _set_timezone(self, tz: str | tzinfo):
         """Set the timezone for formatting.
 
@@ -106,7 +146,7 @@ class DateTimeFormatter:
         if isinstance(tz, str):
             # String timezone ID
             icu_tz = icu.TimeZone.createTimeZone(tz)
-        elif hasattr(tz, "tzname"):
+        elif isinstance(tz, tzinfo):
             # Python tzinfo object - try to get timezone ID
             tz_name = tz.tzname(None)
             if tz_name:
@@ -126,6 +166,31 @@ class DateTimeFormatter:
 
         self._formatter.setTimeZone(icu_tz)
 
+    def _resolve_tzinfo(self, dt: datetime) -> tuple[icu.TimeZone, bool]:
+        """Map an aware datetime's tzinfo to an ICU timezone.
+
+        The ICU zone depends only on the name the tzinfo reports for dt, so
+        results are cached by that name. tzinfo objects themselves are not
+        usable as keys: datetime.timezone compares by offset alone, so
+        zones sharing an offset would collide.
+
+        Args:
+            dt: Timezone-aware datetime.
+
+        Returns:
+            Tuple of the ICU timezone and whether it is UTC.
+        """
+        tz_name = dt.tzname()
+        resolved = self._tzinfo_cache.get(tz_name)
+        if resolved is None:
+            if tz_name and tz_name != "UTC":
+                resolved = (icu.TimeZone.createTimeZone(tz_name), False)
+            else:
+                # Handle UTC explicitly, and fall back to GMT if no name available
+                resolved = (icu.TimeZone.getGMT(), True)
+            self._tzinfo_cache[tz_name] = resolved
+        return resolved
+
     def format(self, dt: datetime, tz: str | None = None) -> str:
         """Format a datetime object to a string.
 
@@ -145,13 +210,24 @@ class DateTimeFormatter:
             >>> formatter.format(datetime(2025, 1, 25, 15, 30))
             '25 janvier 2025 à 15:30'
         """
-        # Create ICU Calendar and set the datetime
-        cal = icu.GregorianCalendar()
-        # Note: ICU months are 0-based
-        cal.set(dt.year, dt.month - 1, dt.day, dt.hour, dt.minute, dt.second)
-        cal.set(icu.Calendar.MILLISECOND, dt.microsecond // 1000)
+        return self._formatter.format(self._to_udate(dt, tz))
+
+    def _to_udate(self, dt: datetime, tz: str | None = None) -> float:
+        """Convert a datetime to an ICU UDate, as format() reads it.
+
+        Switches the formatter to the timezone in use (tz, else dt's tzinfo),
+        so that formatting the result shows dt's wall-clock fields.
+
+        Args:
+            dt: The datetime to convert.
+            tz: Optional timezone identifier, as accepted by format().
 
+        Returns:
+            Seconds since the epoch, as PyICU represents UDate.
+        """
         # Handle timezone
+        icu_tz = None
+        is_utc = False
         if tz:
             # Explicit timezone provided
             if tz == 'UTC' and dt.tzinfo is None:
@@ -159,26 +235,172 @@ class DateTimeFormatter:
                 from datetime import timezone as pytz
                 dt = dt.replace(tzinfo=pytz.utc)
             icu_tz = icu.TimeZone.createTimeZone(tz)
-            cal.setTimeZone(icu_tz)
-            self._formatter.setTimeZone(icu_tz)
+            is_utc = tz == "UTC"
         elif dt.tzinfo:
             # Use datetime's timezone info
-            tz_name = dt.tzinfo.tzname(dt)
-            if tz_name == "UTC":
-                # Handle UTC explicitly
-                icu_tz = icu.TimeZone.getGMT()
-            elif tz_name:
-                icu_tz = icu.TimeZone.createTimeZone(tz_name)
-            else:
-                # Fallback to GMT if no name available
-                icu_tz = icu.TimeZone.getGMT()
-            cal.setTimeZone(icu_tz)
-            self._formatter.setTimeZone(icu_tz)
+            icu_tz, is_utc = self._resolve_tzinfo(dt)
 
         # Get the ICU time value
-        icu_time = cal.getTime()
+        if is_utc and dt.year > _GREGORIAN_CUTOVER_YEAR:
+            # UTC has no offset to resolve, so skip the Calendar entirely
+            icu_time = _utc_udate(dt)
+        else:
+            cal = icu.GregorianCalendar() if icu_tz is None else icu.GregorianCalendar(icu_tz)
+            # Note: ICU months are 0-based
+            cal.set(dt.year, dt.month - 1, dt.day, dt.hour, dt.minute, dt.second)
+            cal.set(icu.Calendar.MILLISECOND, dt.microsecond // 1000)
+            icu_time = cal.getTime()
+
+        if icu_tz is not None:
+            self._formatter.setTimeZone(icu_tz)
+
+        return icu_time
+
+    def format_many(self, dts: Iterable[datetime], tz: str | None = None) -> list[str]:
+        """Format a batch of datetime objects.
+
+        Produces the same strings as calling format() on each item, but binds
+        the formatter once and reuses a single Calendar for naive datetimes.
+
+        Args:
+            dts: Iterable of datetimes to format.
+            tz: Optional timezone identifier to use for formatting.
+
+        Returns:
+            List of formatted date/time strings, in input order.
+
+        Example:
+            >>> formatter = DateTimeFormatter('en-US', pattern='yyyy-MM-dd')
+            >>> formatter.format_many([datetime(2025, 1, 3), datetime(2025, 1, 5)])
+            ['2025-01-03', '2025-01-05']
+        """
+        format_one = self.format
+        if tz:
+            return [format_one(dt, tz) for dt in dts]
+
+        format_udate = self._formatter.format
+        cal = icu.GregorianCalendar()
+        millisecond = icu.Calendar.MILLISECOND
+        results: list[str] = []
+        append = results.append
+        for dt in dts:
+            if dt.tzinfo is None:
+                cal.clear()
+                # Note: ICU months are 0-based
+                cal.set(dt.year, dt.month - 1, dt.day, dt.hour, dt.minute, dt.second)
+                cal.set(millisecond, dt.microsecond // 1000)
+                append(format_udate(cal.getTime()))
+            else:
+                append(format_one(dt))
+        return results
+
+    def format_timestamps(self, timestamps: Iterable[float]) -> list[str]:
+        """Format a batch of POSIX timestamps.
+
+        Timestamps are passed to ICU as-is, without building datetime or
+        Calendar objects, so this is the fastest way to format many instants.
+        They are shown in the formatter's timezone.
+
+        A NumPy ``datetime64`` array (e.g. a pandas column's ``.to_numpy()``)
+        is also accepted; its values are taken as UTC instants and converted
+        in one vectorized step. NaT values are not supported.
+
+        Args:
+            timestamps: Seconds since the Unix epoch, as from datetime.timestamp(),
+                or a NumPy datetime64 array.
+
+        Returns:
+            List of formatted date/time strings, in input order.
+
+        Example:
+            >>> formatter = DateTimeFormatter('en-US', pattern='yyyy-MM-dd', tz='UTC')
+            >>> formatter.format_timestamps([0, 1735689600.0])
+            ['1970-01-01', '2025-01-01']
+        """
+        # hasattr() narrows the Iterable annotation to the NumPy array case
+        dtype = getattr(timestamps, "dtype", None)
+        if dtype is not None and dtype.kind == "M" and hasattr(timestamps, "astype"):
+            # datetime64 array: truncate to milliseconds and scale to seconds in NumPy
+            timestamps = (timestamps.astype("datetime64[ms]").astype("int64") / 1000).tolist()
+
+        # PyICU's UDate is float seconds; ints are not accepted
+        return list(map(self._formatter.format, map(float, timestamps)))
+
+    def parse(self, text: str) -> datetime:
+        """Parse a string produced by this formatter's pattern or style.
+
+        Args:
+            text: The date/time string to parse.
+
+        Returns:
+            Naive datetime holding the parsed wall-clock fields, read in the
+            formatter's timezone.
+
+        Raises:
+            OperationError: If the text does not match the format.
+
+        Example:
+            >>> formatter = DateTimeFormatter('en-US', pattern='yyyy-MM-dd HH:mm')
+            >>> formatter.parse('2025-01-25 15:30')
+            datetime.datetime(2025, 1, 25, 15, 30)
+        """
+        return self.parse_many((text,))[0]
+
+    def parse_many(self, texts: Iterable[str]) -> list[datetime]:
+        """Parse a batch of date/time strings.
+
+        Produces the same results as calling parse() on each item, but reuses
+        a single Calendar and ParsePosition for the whole batch.
+
+        Args:
+            texts: Iterable of date/time strings to parse.
+
+        Returns:
+            List of naive datetimes, in input order.
+
+        Raises:
+            OperationError: If any text does not match the format.
+        """
+        parse = self._formatter.parse
+        cal = icu.GregorianCalendar(self._formatter.getTimeZone())
+        get = cal.get
+        pos = icu.ParsePosition(0)
+        results: list[datetime] = []
+        append = results.append
+        for text in texts:
+            # Start from empty fields so nothing leaks from the previous item
+            cal.clear()
+            pos.setIndex(0)
+            pos.setErrorIndex(-1)
+            parse(text, cal, pos)
+
+            # ParsePosition counts UTF-16 code units
+            length = len(text) if text.isascii() else len(text.encode("utf-16-le")) // 2
+            if pos.getErrorIndex() >= 0 or pos.getIndex() != length:
+                index = pos.getErrorIndex() if pos.getErrorIndex() >= 0 else pos.getIndex()
+                msg = f"Failed to parse '{text}' at position {index}"
+                raise OperationError(msg)
 
-        return self._formatter.format(icu_time)
+            try:
+                if get(icu.Calendar.ERA) == 0:
+                    msg = "year is before 1 AD"
+                    raise ValueError(msg)
+                append(
+                    datetime(  # ICU returned a wall-clock time with no zone # noqa: DTZ001
+                        get(icu.Calendar.YEAR),
+                        # Note: ICU months are 0-based
+                        get(icu.Calendar.MONTH) + 1,
+                        get(icu.Calendar.DATE),
+                        get(icu.Calendar.HOUR_OF_DAY),
+                        get(icu.Calendar.MINUTE),
+                        get(icu.Calendar.SECOND),
+                        get(icu.Calendar.MILLISECOND) * 1000,
+                    )
+                )
+            except ValueError as e:
+                msg = f"Parsed date for '{text}' is out of range: {e}"
+                raise OperationError(msg) from e
+        return results
 
     def format_range(self, start: datetime, end: datetime) -> str:
         """Format a date/time range.
@@ -197,13 +419,53 @@ class DateTimeFormatter:
             >>> formatter.format_range(start, end)
             'Jan 3 - 5, 2025'
         """
-        # Simple range formatting using individual format calls
-        # TODO: Implement proper ICU DateIntervalFormat when available
+        if self._interval_skeleton is None or start.tzname() != end.tzname():
+            # Endpoints in different zones cannot share one interval format
+            return self._format_range_fallback(start, end)
+
+        start_udate = self._to_udate(start)
+        end_udate = self._to_udate(end)
+
+        interval_formatter = self._interval_formatter
+        if interval_formatter is None:
+            interval_formatter = icu.DateIntervalFormat.createInstance(
+                self._interval_skeleton, self._locale._icu_locale
+            )
+            self._interval_formatter = interval_formatter
+
+        # DateIntervalFormat would use ICU's default zone; Calendar endpoints carry
+        # the zone format() would show them in
+        zone = self._formatter.getTimeZone()
+        start_cal = icu.GregorianCalendar(zone)
+        start_cal.setTime(start_udate)
+        end_cal = icu.GregorianCalendar(zone)
+        end_cal.setTime(end_udate)
+        value = interval_formatter.formatToValue(start_cal, end_cal)
+        result = str(value)
+
+        # Span fields 0 and 1 mark the endpoints; only the separator between
+        # them is normalized, the rest of the locale's pattern is kept as is
+        position = icu.ConstrainedFieldPosition()
+        position.constrainCategory(icu.UFieldCategory.DATE_INTERVAL_SPAN)
+        spans: dict[int, tuple[int, int]] = {}
+        while value.nextPosition(position):
+            spans[position.getField()] = (position.getStart(), position.getLimit())
+        if 0 not in spans or 1 not in spans:
+            # Endpoints that format alike collapse to a single date
+            return result
+        # Field positions count UTF-16 code units, so slice the encoded text
+        units = result.encode("utf-16-le")
+        separator_start, separator_end = 2 * spans[0][1], 2 * spans[1][0]
+        head = units[:separator_start].decode("utf-16-le")
+        separator = units[separator_start:separator_end].decode("utf-16-le").translate(_RANGE_TRANSLATION)
+        tail = units[separator_end:].decode("utf-16-le")
+        return head + separator + tail
+
+    def _format_range_fallback(self, start: datetime, end: datetime) -> str:
+        """Format a range by joining two individually formatted endpoints."""
         start_str = self.format(start)
         end_str = self.format(end)
 
-        # Simple range formatting - just join with dash
-        # In a full implementation, this would use proper interval formatting
         if start.date() == end.date():
             # Same date, just show date once
             result = start_str
@@ -221,7 +483,7 @@ class DateTimeFormatter:
         else:
             result = f"{start_str} - {end_str}"
 
-        return result.replace("-", "-")  # Use standard hyphen instead of en dash
+        return result
 
     @property
     def pattern(self) -> str | None:
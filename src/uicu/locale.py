@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 from __future__ import annotations
 
+import weakref
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 import icu
@@ -26,15 +28,44 @@ formatters, and segmenters.
 """
 
 
+# Interned Locale instances, keyed by canonical ICU locale ID; entries go away
+# with the last reference so arbitrary tags cannot grow the table without bound
+_LOCALE_INTERN: weakref.WeakValueDictionary[str, Locale] = weakref.WeakValueDictionary()
+
+
 class Locale:
     """Represents a specific locale and creates locale-aware services.
 
     This class wraps ICU's Locale functionality and provides factory methods
     for creating various locale-aware services.
+
+    Locales are immutable and interned: constructing the same locale twice,
+    even from differently spelled tags, returns the same instance.
     """
 
-    def __init__(self, language_tag: str):
-        """Initialize a locale.
+    __slots__ = (
+        "__weakref__",
+        "_base_name",
+        "_country",
+        "_hash",
+        "_icu_locale",
+        "_language",
+        "_language_tag",
+        "_script",
+        "_variant",
+    )
+
+    _base_name: str
+    _country: str
+    _hash: int
+    _icu_locale: icu.Locale
+    _language: str
+    _language_tag: str
+    _script: str
+    _variant: str
+
+    def __new__(cls, language_tag: str) -> Locale:  # May return an interned instance # noqa: PYI034
+        """Return the locale for a language tag.
 
         Args:
             language_tag: BCP 47 language tag (e.g. 'en-US', 'fr-FR')
@@ -43,18 +74,37 @@ class Locale:
             ConfigurationError: If locale creation fails
         """
         try:
-            self._icu_locale = icu.Locale(language_tag)
+            icu_locale = icu.Locale(language_tag)
         except Exception as e:
             msg = f"Failed to create locale for '{language_tag}': {e}"
             raise ConfigurationError(msg) from e
 
-        self._language_tag = language_tag
+        name = icu_locale.getName()
+        if cls is Locale:
+            interned = _LOCALE_INTERN.get(name)
+            if interned is not None:
+                return interned
+
+        self = super().__new__(cls)
+        self._icu_locale = icu_locale
 
         # Cache commonly accessed properties
-        self._language = self._icu_locale.getLanguage()
-        self._script = self._icu_locale.getScript()
-        self._country = self._icu_locale.getCountry()  # ICU uses "country" for region
-        self._variant = self._icu_locale.getVariant()
+        self._base_name = icu_locale.getBaseName()
+        self._language_tag = self._base_name.replace("_", "-")
+        self._language = icu_locale.getLanguage()
+        self._script = icu_locale.getScript()
+        self._country = icu_locale.getCountry()  # ICU uses "country" for region
+        self._variant = icu_locale.getVariant()
+        self._hash = hash(self._base_name)
+
+        if cls is Locale:
+            # Another thread may have interned the same locale meanwhile
+            self = _LOCALE_INTERN.setdefault(name, self)
+        return self
+
+    def __reduce__(self) -> tuple[type[Locale], tuple[str]]:
+        """Recreate (and re-intern) the locale from its full ICU ID."""
+        return (type(self), (self._icu_locale.getName(),))
 
     @property
     def display_name(self) -> str:
@@ -114,7 +164,7 @@ class Locale:
     @property
     def base_name(self) -> str:
         """The canonical locale identifier (e.g., 'en_GB', 'zh_Hant_TW')."""
-        return self._icu_locale.getBaseName()
+        return self._base_name
 
     @property
     def language_tag(self) -> str:
@@ -123,7 +173,7 @@ class Locale:
         Returns:
             Language tag with hyphens (e.g., 'en-GB', 'zh-Hant-TW').
         """
-        return self.base_name.replace("_", "-")
+        return self._language_tag
 
     # Factory methods for locale-aware services
 
@@ -291,30 +341,51 @@ class Locale:
     def __eq__(self, other) -> bool:
         """Compare locales."""
         if isinstance(other, Locale):
-            return self.base_name == other.base_name
+            return self._base_name == other._base_name
         return NotImplemented
 
     def __hash__(self) -> int:
         """Hash based on base name."""
-        return hash(self.base_name)
+        return self._hash
 
 
 # Convenience functions
 
 
+@lru_cache(maxsize=1)
+def _available_locale_ids() -> tuple[str, ...]:
+    """Enumerate ICU's available locales once and keep them sorted."""
+    # getAvailableLocales returns strings; skip the empty root locale
+    return tuple(sorted(locale_id.replace("_", "-") for locale_id in icu.Locale.getAvailableLocales() if locale_id))
+
+
+@lru_cache(maxsize=1)
+def _available_locale_set() -> frozenset[str]:
+    """Available locale identifiers as a set, for membership tests."""
+    return frozenset(_available_locale_ids())
+
+
 def get_available_locales() -> list[str]:
     """Get list of available locale identifiers.
 
+    ICU is queried on the first call only.
+
     Returns:
         List of locale identifiers supported by ICU.
     """
-    # Get all available locales from ICU
-    locales = []
-    for locale_id in icu.Locale.getAvailableLocales():
-        if locale_id:  # Skip empty locale
-            # getAvailableLocales returns strings
-            locales.append(locale_id.replace("_", "-"))
-    return sorted(locales)
+    return list(_available_locale_ids())
+
+
+def is_locale_available(language_tag: str) -> bool:
+    """Check whether ICU has data for a locale.
+
+    Args:
+        language_tag: BCP 47 language tag (e.g. 'en-US'); underscores are accepted.
+
+    Returns:
+        True if the locale is among get_available_locales().
+    """
+    return language_tag.replace("_", "-") in _available_locale_set()
 
 
 def get_default_locale() -> Locale:
@@ -1,6 +1,11 @@
 #!/usr/bin/env python
 from __future__ import annotations
 
+import re
+import threading
+from array import array
+from bisect import bisect_left
+from itertools import pairwise
 from typing import TYPE_CHECKING
 
 import icu
@@ -18,6 +23,19 @@ if TYPE_CHECKING:
 
 # from uicu.exceptions import ConfigurationError  # Currently unused
 
+# Finds the first alphanumeric character; same set as str.isalnum()
+_find_alnum = re.compile(r"[^\W_]").search
+
+# Highest code point of the Basic Multilingual Plane; beyond it UTF-16 needs
+# two code units per character
+_MAX_BMP = 0xFFFF
+
+# Idle break iterators for the functional API, keyed by (kind, locale ID)
+_iterator_pool = threading.local()
+
+# Most idle iterators each thread keeps; the least recently used go first
+_MAX_POOLED_ITERATORS = 16
+
 
 def _create_break_iterator(
     kind: str,
@@ -51,14 +69,126 @@ def _create_break_iterator(
     raise ValueError(msg)
 
 
+def _get_iterator_pool() -> dict[tuple[str, str], icu.BreakIterator]:
+    """Return the current thread's pool of idle break iterators."""
+    pool: dict[tuple[str, str], icu.BreakIterator]
+    try:
+        pool = _iterator_pool.iterators
+    except AttributeError:
+        pool = _iterator_pool.iterators = {}
+    return pool
+
+
+def _acquire_break_iterator(
+    kind: str,
+    locale: Locale | None = None,
+) -> tuple[tuple[str, str], icu.BreakIterator]:
+    """Take a break iterator from the current thread's pool, creating one if needed.
+
+    ICU break iterators are stateful, so an iterator stays out of the pool
+    until it is released. Interleaved generators each get their own.
+
+    Args:
+        kind: Type of iterator - 'character', 'word', 'sentence', or 'line'.
+        locale: Optional locale for locale-specific rules.
+
+    Returns:
+        Tuple of the pool key and the break iterator.
+    """
+    icu_locale = icu.Locale.getDefault() if locale is None else locale._icu_locale
+    key = (kind, icu_locale.getName())
+    break_iterator = _get_iterator_pool().pop(key, None)
+    if break_iterator is None:
+        break_iterator = _create_break_iterator(kind, locale)
+    return key, break_iterator
+
+
+def _release_break_iterator(key: tuple[str, str], break_iterator: icu.BreakIterator) -> None:
+    """Return a break iterator to the current thread's pool."""
+    pool = _get_iterator_pool()
+    pool[key] = break_iterator
+    if len(pool) > _MAX_POOLED_ITERATORS:
+        # Acquiring pops the entry, so the first one is the least recently used
+        del pool[next(iter(pool))]
+
+
+def _iterate_pooled_breaks(
+    text: str,
+    kind: str,
+    locale: Locale | None = None,
+) -> Iterator[str]:
+    """Iterate over text segments using a pooled break iterator.
+
+    Args:
+        text: Text to segment.
+        kind: Type of iterator - 'character', 'word', 'sentence', or 'line'.
+        locale: Optional locale for locale-specific rules.
+
+    Yields:
+        Text segments as strings.
+    """
+    if not text:
+        return
+
+    key, break_iterator = _acquire_break_iterator(kind, locale)
+    try:
+        yield from _iterate_breaks(text, break_iterator)
+    finally:
+        _release_break_iterator(key, break_iterator)
+
+
+class _BoundaryArray(array):
+    """Ascending array of boundary positions with O(log n) membership tests."""
+
+    __slots__ = ()
+
+    def __contains__(self, position: object) -> bool:
+        try:
+            index = bisect_left(self, position)
+        except TypeError:
+            return False
+        return index < len(self) and self[index] == position
+
+
+def _is_bmp(text: str) -> bool:
+    """Check whether text lies entirely in the BMP.
+
+    For such text, UTF-16 offsets reported by ICU equal Python string
+    indices, so no offset table is needed.
+    """
+    return text.isascii() or max(map(ord, text)) <= _MAX_BMP
+
+
+def _utf16_offsets(text: str) -> array:
+    """Build a table mapping UTF-16 code unit offsets to Python string offsets.
+
+    Callers check _is_bmp() first; BMP text needs no table.
+
+    Args:
+        text: Text the offsets refer to.
+
+    Returns:
+        Array indexed by UTF-16 offset.
+    """
+    offsets = array("i")
+    append = offsets.append
+    for index, char in enumerate(text):
+        append(index)
+        if ord(char) > _MAX_BMP:
+            # Low surrogate; break iterators never stop here
+            append(index + 1)
+    append(len(text))
+    return offsets
+
+
 def _iterate_breaks(
     text: str,
     break_iterator: icu.BreakIterator,
 ) -> Iterator[str]:
     """Iterate over text segments using a break iterator.
 
-    This handles the UTF-16 index conversion issue by using ICU's
-    UnicodeString internally.
+    ICU reports UTF-16 offsets; for text outside the BMP these are mapped
+    back to Python string positions before slicing.
 
     Args:
         text: Text to segment.
@@ -70,19 +200,120 @@ def _iterate_breaks(
     if not text:
         return
 
+    if _is_bmp(text):
+        # BMP text has identical UTF-16 and Python indices, so slice directly
+        break_iterator.setText(text)
+        start = 0
+        for end in break_iterator:
+            if end == icu.BreakIterator.DONE:
+                break
+            yield text[start:end]
+            start = end
+        return
+
     # Convert to ICU UnicodeString to handle UTF-16 indices correctly
     utext = icu.UnicodeString(text)
     break_iterator.setText(utext)
+    offsets = _utf16_offsets(text)
+
+    # Slice the original string at the converted break positions
+    start = 0
+    for position in break_iterator:
+        if position == icu.BreakIterator.DONE:
+            break
+        end = offsets[position]
+        yield text[start:end]
+        start = end
+
+
+def _single_char_graphemes(text: str) -> bool:
+    """Check whether every character of text is its own grapheme cluster.
+
+    Under UAX #29 each ASCII character forms a separate cluster, except
+    that CR LF is kept together. No locale tailors these rules.
+    """
+    return text.isascii() and "\r\n" not in text
+
+
+def _break_list(text: str, break_iterator: icu.BreakIterator) -> list[str]:
+    """Segment text into a list in a single pass.
+
+    Collects all boundaries first and slices them in one comprehension,
+    avoiding per-segment generator overhead.
+
+    Args:
+        text: Text to segment.
+        break_iterator: Configured break iterator.
+
+    Returns:
+        List of text segments.
+    """
+    if not text:
+        return []
+
+    if _is_bmp(text):
+        # BMP text has identical UTF-16 and Python indices
+        break_iterator.setText(text)
+        ends = list(break_iterator)
+    else:
+        utext = icu.UnicodeString(text)
+        break_iterator.setText(utext)
+        offsets = _utf16_offsets(text)
+        ends = [offsets[end] for end in break_iterator]
+
+    return [text[start:end] for start, end in pairwise([0, *ends])]
+
 
-    # Get break positions
+class PreparedText:
+    """Text converted to UTF-16 once, for reuse across several segmenters.
+
+    Create instances with BaseSegmenter.prepare().
+    """
+
+    __slots__ = ("offsets", "text", "utext")
+
+    def __init__(self, text: str):
+        """Convert text for segmentation.
+
+        Args:
+            text: Text to prepare.
+        """
+        self.text = text
+        self.utext = icu.UnicodeString(text)
+        # BMP text has identical UTF-16 and Python indices
+        self.offsets = None if _is_bmp(text) else _utf16_offsets(text)
+
+    def __repr__(self) -> str:
+        """Return representation."""
+        return f"PreparedText({self.text!r})"
+
+
+def _iterate_prepared(
+    prepared: PreparedText,
+    break_iterator: icu.BreakIterator,
+) -> Iterator[str]:
+    """Iterate over segments of prepared text using a break iterator.
+
+    Args:
+        prepared: Text prepared for segmentation.
+        break_iterator: Configured break iterator.
+
+    Yields:
+        Text segments as slices of the original string.
+    """
+    text = prepared.text
+    if not text:
+        return
+
+    offsets = prepared.offsets
+    break_iterator.setText(prepared.utext)
     start = 0
-    for end in break_iterator:
-        if end == icu.BreakIterator.DONE:
+    for position in break_iterator:
+        if position == icu.BreakIterator.DONE:
             break
-        # Extract segment using UnicodeString slicing
-        segment = utext[start:end]
-        # Convert to Python string
-        yield str(segment)
+        # Convert from UTF-16 to Python string position
+        end = position if offsets is None else offsets[position]
+        yield text[start:end]
         start = end
 
 
@@ -111,14 +342,16 @@ def graphemes(text: str, locale: str | Locale | None = None) -> Iterator[str]:
         >>> list(graphemes('नमस्ते'))  # Devanagari
         ['न', 'म', 'स्', 'ते']  # Note combined characters
     """
+    if _single_char_graphemes(text):
+        # No break iterator needed
+        yield from text
+        return
+
     # Convert string locale to Locale object if needed
     locale_obj = ensure_locale(locale) if locale is not None else None
 
-    # Create character (grapheme) break iterator
-    break_iterator = _create_break_iterator("character", locale_obj)
-
     # Iterate over grapheme clusters
-    yield from _iterate_breaks(text, break_iterator)
+    yield from _iterate_pooled_breaks(text, "character", locale_obj)
 
 
 def words(
@@ -152,18 +385,45 @@ def words(
     # Convert string locale to Locale object if needed
     locale_obj = ensure_locale(locale) if locale is not None else None
 
-    # Create word break iterator
-    break_iterator = _create_break_iterator("word", locale_obj)
-
     # Iterate over words
-    for word in _iterate_breaks(text, break_iterator):
+    for word in _iterate_pooled_breaks(text, "word", locale_obj):
         if skip_whitespace and word.isspace():
             continue
-        if skip_punctuation and all(not c.isalnum() for c in word):
+        if skip_punctuation and not _find_alnum(word):
             continue
         yield word
 
 
+def contains_word(text: str, word: str, locale: str | Locale | None = None) -> bool:
+    """Check whether text contains word as a whole word token.
+
+    Unlike a substring test, 'cat' is not found in 'concatenate'.
+    Segmentation stops at the first match.
+
+    Args:
+        text: Text to search.
+        word: Word to look for; must be a single word token to match.
+        locale: Optional locale for locale-specific rules.
+
+    Returns:
+        True if one of the word tokens of text equals word.
+
+    Example:
+        >>> contains_word("Hello, world!", "world")
+        True
+        >>> contains_word("concatenate", "cat")
+        False
+    """
+    # A word that is not even a substring cannot be a token
+    if not word or word not in text:
+        return False
+
+    # Convert string locale to Locale object if needed
+    locale_obj = ensure_locale(locale) if locale is not None else None
+
+    return word in _iterate_pooled_breaks(text, "word", locale_obj)
+
+
 def sentences(text: str, locale: str | Locale | None = None) -> Iterator[str]:
     """Iterate over sentences according to locale rules.
 
@@ -185,11 +445,8 @@ def sentences(text: str, locale: str | Locale | None = None) -> Iterator[str]:
     # Convert string locale to Locale object if needed
     locale_obj = ensure_locale(locale) if locale is not None else None
 
-    # Create sentence break iterator
-    break_iterator = _create_break_iterator("sentence", locale_obj)
-
     # Iterate over sentences
-    yield from _iterate_breaks(text, break_iterator)
+    yield from _iterate_pooled_breaks(text, "sentence", locale_obj)
 
 
 def lines(text: str, locale: str | Locale | None = None) -> Iterator[str]:
@@ -208,11 +465,8 @@ def lines(text: str, locale: str | Locale | None = None) -> Iterator[str]:
     # Convert string locale to Locale object if needed
     locale_obj = ensure_locale(locale) if locale is not None else None
 
-    # Create line break iterator
-    break_iterator = _create_break_iterator("line", locale_obj)
-
     # Iterate over line segments
-    yield from _iterate_breaks(text, break_iterator)
+    yield from _iterate_pooled_breaks(text, "line", locale_obj)
 
 
 def line_breaks(text: str, locale: str | Locale | None = None) -> Iterator[int]:
@@ -231,23 +485,37 @@ def line_breaks(text: str, locale: str | Locale | None = None) -> Iterator[int]:
     # Convert string locale to Locale object if needed
     locale_obj = ensure_locale(locale) if locale is not None else None
 
-    # Create line break iterator
-    break_iterator = _create_break_iterator("line", locale_obj)
+    if not text:
+        return
 
-    # Set text
-    uset = icu.UnicodeString(text)
-    break_iterator.setText(uset)
+    # Take a line break iterator from the pool
+    key, break_iterator = _acquire_break_iterator("line", locale_obj)
+    try:
+        if _is_bmp(text):
+            # BMP text has identical UTF-16 and Python indices, so no
+            # UnicodeString or offset table is needed
+            break_iterator.setText(text)
+            length = len(text)
+            for position in break_iterator:
+                if position < length:
+                    yield position
+            return
 
-    # Get all boundaries
-    position = break_iterator.first()
-    while position != icu.BreakIterator.DONE:
-        # Convert from UTF-16 to Python string position
-        utf16_pos = position
-        if utf16_pos > 0 and utf16_pos < len(uset):
-            # Calculate Python string position
-            python_pos = len(str(uset[:utf16_pos]))
-            yield python_pos
-        position = break_iterator.nextBoundary()
+        # Set text
+        uset = icu.UnicodeString(text)
+        break_iterator.setText(uset)
+        utf16_length = len(uset)
+        offsets = _utf16_offsets(text)
+
+        # Get all boundaries
+        position = break_iterator.first()
+        while position != icu.BreakIterator.DONE:
+            if 0 < position < utf16_length:
+                # Convert from UTF-16 to Python string position
+                yield offsets[position]
+            position = break_iterator.nextBoundary()
+    finally:
+        _release_break_iterator(key, break_iterator)
 
 
 # OOP Interface
@@ -256,6 +524,8 @@ def line_breaks(text: str, locale: str | Locale | None = None) -> Iterator[int]:
 class BaseSegmenter:
     """Base class for text segmenters."""
 
+    __slots__ = ("_break_iterator", "_locale")
+
     def __init__(self, locale: str | Locale | None = None):
         """Initialize segmenter with optional locale.
 
@@ -270,6 +540,20 @@ class BaseSegmenter:
         """Create the break iterator. Subclasses must implement."""
         raise NotImplementedError
 
+    def prepare(self, text: str) -> PreparedText:
+        """Convert text once for repeated segmentation.
+
+        The result can be passed to segment_prepared() on any segmenter,
+        avoiding a fresh UTF-16 conversion for each pass over the same text.
+
+        Args:
+            text: Text to prepare.
+
+        Returns:
+            Prepared text.
+        """
+        return PreparedText(text)
+
     def segment(self, text: str) -> Iterator[str]:
         """Segment text into parts.
 
@@ -279,7 +563,26 @@ class BaseSegmenter:
         Yields:
             Text segments.
         """
-        yield from _iterate_breaks(text, self._break_iterator)
+        # BMP text is segmented without a UnicodeString or offset table
+        yield from self._filter_segments(_iterate_breaks(text, self._break_iterator))
+
+    def segment_prepared(self, prepared: PreparedText) -> Iterator[str]:
+        """Segment text previously converted with prepare().
+
+        Args:
+            prepared: Prepared text.
+
+        Yields:
+            Text segments.
+        """
+        yield from self._filter_segments(_iterate_prepared(prepared, self._break_iterator))
+
+    def _filter_segments(self, segments: Iterator[str]) -> Iterator[str]:
+        """Filter the segments yielded by segment() and segment_prepared().
+
+        Subclasses may override this to drop segments; the default keeps all.
+        """
+        return segments
 
     def segment_list(self, text: str) -> list[str]:
         """Segment text into a list.
@@ -290,46 +593,116 @@ class BaseSegmenter:
         Returns:
             List of text segments.
         """
-        return list(self.segment(text))
+        return _break_list(text, self._break_iterator)
 
-    def boundaries(self, text: str) -> set[int]:
+    def boundaries(self, text: str) -> array:
         """Get boundary positions in text.
 
         Args:
             text: Text to analyze.
 
         Returns:
-            Set of boundary positions (character indices).
+            Array of boundary positions (character indices) in ascending order.
+            Membership tests on it use binary search.
         """
-        # Set text
-        uset = icu.UnicodeString(text)
-        self._break_iterator.setText(uset)
+        # The start of the text is always a boundary; iteration yields the rest
+        boundaries = _BoundaryArray("i", [0])
+        if not text:
+            return boundaries
 
-        # Collect all boundaries
-        boundaries = set()
-        position = self._break_iterator.first()
-        while position != icu.BreakIterator.DONE:
-            # Convert from UTF-16 to Python string position
-            if position == 0:
-                boundaries.add(0)
-            elif position >= len(uset):
-                boundaries.add(len(text))
-            else:
-                # Calculate Python string position
-                python_pos = len(str(uset[:position]))
-                boundaries.add(python_pos)
-            position = self._break_iterator.nextBoundary()
+        break_iterator = self._break_iterator
+
+        if _is_bmp(text):
+            # BMP text has identical UTF-16 and Python indices
+            break_iterator.setText(text)
+            boundaries.extend(break_iterator)
+            return boundaries
 
+        uset = icu.UnicodeString(text)
+        break_iterator.setText(uset)
+        # Convert from UTF-16 to Python string positions
+        offsets = _utf16_offsets(text)
+        boundaries.extend(offsets[position] for position in break_iterator)
         return boundaries
 
+    def scan(self, text: str) -> tuple[list[str], array]:
+        """Segment text and get its boundary positions in a single pass.
+
+        Prefer this over calling segment_list() and boundaries() separately
+        when both are needed; the text is converted and iterated only once.
+
+        Args:
+            text: Text to analyze.
+
+        Returns:
+            Tuple of the segments, as segment_list() returns them, and the
+            boundary positions, as boundaries() returns them.
+        """
+        boundaries = self.boundaries(text)
+        segments = [text[start:end] for start, end in pairwise(boundaries)]
+        return segments, boundaries
+
+    def boundary_set(self, text: str) -> set[int]:
+        """Get boundary positions in text as a set, for fast membership tests.
+
+        Args:
+            text: Text to analyze.
+
+        Returns:
+            Set of boundary positions (character indices).
+        """
+        return set(self.boundaries(text))
+
 
 class GraphemeSegmenter(BaseSegmenter):
     """Reusable grapheme cluster segmenter."""
 
+    __slots__ = ()
+
     def _create_break_iterator(self) -> icu.BreakIterator:
         """Create character break iterator."""
         return _create_break_iterator("character", self._locale)
 
+    def segment(self, text: str) -> Iterator[str]:
+        """Segment text into grapheme clusters.
+
+        Args:
+            text: Text to segment.
+
+        Yields:
+            Grapheme clusters.
+        """
+        if _single_char_graphemes(text):
+            yield from text
+        else:
+            yield from super().segment(text)
+
+    def segment_list(self, text: str) -> list[str]:
+        """Segment text into a list of grapheme clusters.
+
+        Args:
+            text: Text to segment.
+
+        Returns:
+            List of grapheme clusters.
+        """
+        if _single_char_graphemes(text):
+            return list(text)
+        return super().segment_list(text)
+
+    def boundaries(self, text: str) -> array:
+        """Get grapheme cluster boundary positions in text.
+
+        Args:
+            text: Text to analyze.
+
+        Returns:
+            Array of boundary positions (character indices) in ascending order.
+        """
+        if _single_char_graphemes(text):
+            return _BoundaryArray("i", range(len(text) + 1))
+        return super().boundaries(text)
+
     def __repr__(self) -> str:
         """Return representation."""
         locale_str = self._locale.language_tag if self._locale else "default"
@@ -339,6 +712,8 @@ class GraphemeSegmenter(BaseSegmenter):
 class WordSegmenter(BaseSegmenter):
     """Reusable word segmenter."""
 
+    __slots__ = ("_skip_whitespace",)
+
     def __init__(
         self,
         locale: str | Locale | None = None,
@@ -358,19 +733,40 @@ class WordSegmenter(BaseSegmenter):
         """Create word break iterator."""
         return _create_break_iterator("word", self._locale)
 
-    def segment(self, text: str) -> Iterator[str]:
-        """Segment text into words.
+    def _filter_segments(self, segments: Iterator[str]) -> Iterator[str]:
+        """Drop whitespace tokens if skip_whitespace is set."""
+        if self._skip_whitespace:
+            return (word for word in segments if not word.isspace())
+        return segments
+
+    def segment_list(self, text: str) -> list[str]:
+        """Segment text into a list of words.
 
         Args:
             text: Text to segment.
 
-        Yields:
-            Word tokens.
+        Returns:
+            List of word tokens.
         """
-        for word in super().segment(text):
-            if self._skip_whitespace and word.isspace():
-                continue
-            yield word
+        words = super().segment_list(text)
+        if self._skip_whitespace:
+            return [word for word in words if not word.isspace()]
+        return words
+
+    def scan(self, text: str) -> tuple[list[str], array]:
+        """Segment text into words and get all boundary positions in a single pass.
+
+        Args:
+            text: Text to analyze.
+
+        Returns:
+            Tuple of the word tokens and all boundary positions, including
+            those around skipped whitespace.
+        """
+        words, boundaries = super().scan(text)
+        if self._skip_whitespace:
+            words = [word for word in words if not word.isspace()]
+        return words, boundaries
 
     def __repr__(self) -> str:
         """Return representation."""
@@ -381,6 +777,8 @@ class WordSegmenter(BaseSegmenter):
 class SentenceSegmenter(BaseSegmenter):
     """Reusable sentence segmenter."""
 
+    __slots__ = ()
+
     def _create_break_iterator(self) -> icu.BreakIterator:
         """Create sentence break iterator."""
         return _create_break_iterator("sentence", self._locale)
@@ -394,6 +792,8 @@ class SentenceSegmenter(BaseSegmenter):
 class LineSegmenter(BaseSegmenter):
     """Reusable line break segmenter."""
 
+    __slots__ = ()
+
     def _create_break_iterator(self) -> icu.BreakIterator:
         """Create line break iterator."""
         return _create_break_iterator("line", self._locale)
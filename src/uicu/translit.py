@@ -1,8 +1,17 @@
 #!/usr/bin/env python
 from __future__ import annotations
 
+import re
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from collections.abc import Set as AbstractSet
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from typing import TypeVar
+
 import icu
 
+from uicu._utils import _get_cached_transliterator
 from uicu.exceptions import ConfigurationError
 
 # this_file: src/uicu/translit.py
@@ -12,6 +21,101 @@ This module provides Pythonic interfaces for ICU's transliteration functionality
 enabling script conversion and various text transformations.
 """
 
+# Map direction names to ICU constants
+DIRECTION_MAP = {
+    "forward": icu.UTransDirection.FORWARD,
+    "reverse": icu.UTransDirection.REVERSE,
+}
+
+
+# Whitespace around the separators of a compound ID is not significant
+_ID_SEPARATOR = re.compile(r"\s*;\s*")
+
+
+def _canonical_transform_id(transform_id: str) -> str:
+    """Normalize the spacing of a compound transform ID for cache lookups.
+
+    'Greek-Latin; Latin-ASCII' and 'Greek-Latin;Latin-ASCII' build the
+    same chain and share one cached ICU transliterator.
+    """
+    return _ID_SEPARATOR.sub(";", transform_id.strip())
+
+
+def _unchanged(text: str) -> str:
+    """Return text as is."""
+    return text
+
+
+# Pure-Python equivalents of transforms on ASCII text, keyed by effective ID.
+# Every Latin-ASCII rule matches a non-ASCII character; its NFD/NFC passes
+# are no-ops on ASCII. Title is left out: str.title() capitalizes after an
+# apostrophe, ICU does not.
+_ASCII_TRANSFORMS: dict[str, Callable[[str], str]] = {
+    "NFC": _unchanged,
+    "NFD": _unchanged,
+    "NFKC": _unchanged,
+    "NFKD": _unchanged,
+    "LATIN-ASCII": _unchanged,
+    "UPPER": str.upper,
+    "LOWER": str.lower,
+}
+
+
+def _get_ascii_transform(icu_trans: icu.Transliterator) -> Callable[[str], str] | None:
+    """Return a pure-Python equivalent of a transliterator for ASCII text.
+
+    str() of an ICU transliterator is its effective ID, which already
+    accounts for direction (e.g. reverse 'NFC' is 'NFD').
+    """
+    transform_id = str(icu_trans).upper()
+    return _ASCII_TRANSFORMS.get(transform_id.removeprefix("ANY-"))
+
+
+def _get_icu_direction(direction: str) -> int:
+    """Map a direction name to its ICU constant.
+
+    Raises:
+        ConfigurationError: If direction is not 'forward' or 'reverse'.
+    """
+    try:
+        return DIRECTION_MAP[direction]
+    except KeyError:
+        msg = f"Invalid direction '{direction}'. Must be 'forward' or 'reverse'."
+        raise ConfigurationError(msg) from None
+
+
+_T = TypeVar("_T")
+
+
+class _UnicodeSetView(AbstractSet[str]):
+    """Read-only set view over an ICU UnicodeSet.
+
+    Membership tests go straight to ICU, so large sets (e.g. the source set
+    of Han-Latin) are never materialized as Python sets.
+    """
+
+    __slots__ = ("_uset",)
+
+    def __init__(self, uset: icu.UnicodeSet):
+        self._uset = uset
+
+    @classmethod
+    def _from_iterable(cls, it: Iterable[_T]) -> frozenset[_T]:
+        # Results of set operators are ordinary Python sets
+        return frozenset(it)
+
+    def __contains__(self, item: object) -> bool:
+        return isinstance(item, str) and self._uset.contains(item)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._uset)
+
+    def __len__(self) -> int:
+        return len(self._uset)
+
+    def __repr__(self) -> str:
+        return f"_UnicodeSetView({self._uset.toPattern()!r})"
+
 
 class Transliterator:
     """Reusable transliterator for better performance.
@@ -20,6 +124,18 @@ class Transliterator:
     and text transformation capabilities.
     """
 
+    __slots__ = (
+        "_ascii_transform",
+        "_direction",
+        "_filter_lock",
+        "_inverse_cache",
+        "_inverse_checked",
+        "_private_factory",
+        "_private_transliterator",
+        "_transform_id",
+        "_transliterator",
+    )
+
     def __init__(self, transform_id: str, direction: str = "forward"):
         """Create transliterator.
 
@@ -31,17 +147,11 @@ class Transliterator:
             ConfigurationError: If transform ID is invalid or creation fails.
         """
         # Map direction string to ICU constant
-        if direction == "forward":
-            icu_direction = icu.UTransDirection.FORWARD
-        elif direction == "reverse":
-            icu_direction = icu.UTransDirection.REVERSE
-        else:
-            msg = f"Invalid direction '{direction}'. Must be 'forward' or 'reverse'."
-            raise ConfigurationError(msg)
+        icu_direction = _get_icu_direction(direction)
 
-        # Create ICU transliterator - wrap ICU errors
+        # Share the cached ICU transliterator - wrap ICU errors
         try:
-            self._transliterator = icu.Transliterator.createInstance(transform_id, icu_direction)
+            self._transliterator = _get_cached_transliterator(_canonical_transform_id(transform_id), icu_direction)
         except icu.ICUError as e:
             msg = f"Failed to create transliterator for '{transform_id}': {e}"
             raise ConfigurationError(msg) from e
@@ -49,6 +159,45 @@ class Transliterator:
         # Store configuration
         self._transform_id = transform_id
         self._direction = direction
+        # Inverse wrapper, built on first request; None if there is no inverse
+        self._inverse_cache: Transliterator | None = None
+        self._inverse_checked = False
+        self._ascii_transform = _get_ascii_transform(self._transliterator)
+        # Copy for filtered calls, created on first use, see _filtered()
+        self._private_factory: Callable[[], icu.Transliterator] = partial(
+            icu.Transliterator.createInstance, transform_id, icu_direction
+        )
+        self._private_transliterator: icu.Transliterator | None = None
+        self._filter_lock = threading.Lock()
+
+    @classmethod
+    def _wrap(
+        cls,
+        icu_trans: icu.Transliterator,
+        transform_id: str,
+        direction: str,
+        private_factory: Callable[[], icu.Transliterator],
+        *,
+        ascii_transform: Callable[[str], str] | None = None,
+    ) -> Transliterator:
+        """Wrap an existing ICU transliterator without re-creating it.
+
+        private_factory builds an equivalent, separate ICU transliterator
+        for filtered calls. ascii_transform enables the ASCII fast path. It
+        must stay None for rule-based transliterators, whose names say
+        nothing about their rules.
+        """
+        new_instance = object.__new__(cls)
+        new_instance._transliterator = icu_trans
+        new_instance._private_factory = private_factory
+        new_instance._private_transliterator = None
+        new_instance._filter_lock = threading.Lock()
+        new_instance._transform_id = transform_id
+        new_instance._direction = direction
+        new_instance._inverse_cache = None
+        new_instance._inverse_checked = False
+        new_instance._ascii_transform = ascii_transform
+        return new_instance
 
     def transliterate(self, text: str, filter_fn=None) -> str:
         """Apply transliteration to text.
@@ -57,22 +206,84 @@ class Transliterator:
             text: Input text to transform.
             filter_fn: Optional function to filter which characters to transliterate.
                       Should take a single character and return True to transliterate.
+                      Runs of accepted characters are transliterated together.
 
         Returns:
             Transformed text.
         """
         if filter_fn is None:
+            ascii_transform = self._ascii_transform
+            if ascii_transform is not None and text.isascii():
+                # Equivalent to the ICU transform on ASCII text; skip ICU
+                return ascii_transform(text)
             # ICU transliterate modifies the string in-place if using UnicodeString
             # But with Python strings, it returns a new string
             return self._transliterator.transliterate(text)
-        # Apply transliteration selectively
-        result = []
-        for char in text:
-            if filter_fn(char):
-                result.append(self._transliterator.transliterate(char))
-            else:
-                result.append(char)
-        return "".join(result)
+
+        with self._filtered(filter_fn, set(text)) as icu_trans:
+            return icu_trans.transliterate(text)
+
+    def transliterate_many(self, texts: Iterable[str], filter_fn=None) -> list[str]:
+        """Apply transliteration to a batch of texts.
+
+        Produces the same results as calling transliterate() on each item.
+        A filter_fn is evaluated once per distinct character across the
+        whole batch.
+
+        Args:
+            texts: Iterable of input texts.
+            filter_fn: Optional function to filter which characters to transliterate.
+
+        Returns:
+            List of transformed texts, in input order.
+        """
+        if filter_fn is None:
+            icu_transliterate = self._transliterator.transliterate
+            ascii_transform = self._ascii_transform
+            if ascii_transform is not None:
+                return [ascii_transform(text) if text.isascii() else icu_transliterate(text) for text in texts]
+            return list(map(icu_transliterate, texts))
+
+        texts = list(texts)
+        with self._filtered(filter_fn, set().union(*texts)) as icu_trans:
+            return list(map(icu_trans.transliterate, texts))
+
+    @contextmanager
+    def _filtered(self, filter_fn, chars: set[str]) -> Iterator[icu.Transliterator]:
+        """Temporarily restrict the transliterator to characters accepted by filter_fn.
+
+        The filter is installed on a separate ICU transliterator that
+        unfiltered calls never use, and only while holding this instance's
+        filter lock, so concurrent calls cannot see each other's filters.
+
+        Args:
+            filter_fn: Predicate taking a single character.
+            chars: Distinct characters that will be transliterated.
+
+        Yields:
+            The filtered ICU transliterator.
+        """
+        # Ask filter_fn once per distinct character and hand ICU the result as a
+        # UnicodeSet filter, so each text is transliterated in a single pass
+        selected = icu.UnicodeSet()
+        selected.addAll("".join(filter(filter_fn, chars)))
+
+        with self._filter_lock:
+            icu_trans = self._private_transliterator
+            if icu_trans is None:
+                icu_trans = self._private_transliterator = self._private_factory()
+
+            own_filter = icu_trans.orphanFilter()
+            if own_filter is not None:
+                # Keep the transliterator's built-in filter in effect
+                selected.retainAll(own_filter)
+            icu_trans.adoptFilter(selected)
+            try:
+                yield icu_trans
+            finally:
+                icu_trans.orphanFilter()
+                if own_filter is not None:
+                    icu_trans.adoptFilter(own_filter)
 
     def __call__(self, text: str) -> str:
         """Make transliterator callable.
@@ -94,17 +305,29 @@ class Transliterator:
         Raises:
             ConfigurationError: If inverse is not available.
         """
-        # Create inverse transliterator
-        inverse_trans = self._transliterator.createInverse()
-
-        # Wrap in new Transliterator instance
-        # We need to create a new instance that wraps the inverse
-        new_instance = object.__new__(Transliterator)
-        new_instance._transliterator = inverse_trans
-        new_instance._transform_id = f"{self._transform_id}_inverse"
-        new_instance._direction = "reverse" if self._direction == "forward" else "forward"
-
-        return new_instance
+        inverse = self._get_inverse()
+        if inverse is None:
+            msg = f"No inverse transform available for '{self._transform_id}'"
+            raise ConfigurationError(msg)
+        return inverse
+
+    def _get_inverse(self) -> Transliterator | None:
+        """Return the cached inverse wrapper, creating it on first use."""
+        if not self._inverse_checked:
+            try:
+                inverse_trans = self._transliterator.createInverse()
+            except icu.ICUError:
+                self._inverse_cache = None
+            else:
+                self._inverse_cache = Transliterator._wrap(
+                    inverse_trans,
+                    f"{self._transform_id}_inverse",
+                    "reverse" if self._direction == "forward" else "forward",
+                    self._transliterator.createInverse,
+                    ascii_transform=None if self._ascii_transform is None else _get_ascii_transform(inverse_trans),
+                )
+            self._inverse_checked = True
+        return self._inverse_cache
 
     @classmethod
     def from_rules(cls, name: str, rules: str, direction: str = "forward") -> Transliterator:
@@ -122,24 +345,14 @@ class Transliterator:
             ConfigurationError: If rules are invalid.
         """
         # Map direction string to ICU constant
-        if direction == "forward":
-            icu_direction = icu.UTransDirection.FORWARD
-        elif direction == "reverse":
-            icu_direction = icu.UTransDirection.REVERSE
-        else:
-            msg = f"Invalid direction '{direction}'. Must be 'forward' or 'reverse'."
-            raise ConfigurationError(msg)
+        icu_direction = _get_icu_direction(direction)
 
         # Create transliterator from rules
         icu_trans = icu.Transliterator.createFromRules(name, rules, icu_direction)
 
         # Wrap in new Transliterator instance
-        new_instance = object.__new__(cls)
-        new_instance._transliterator = icu_trans
-        new_instance._transform_id = name
-        new_instance._direction = direction
-
-        return new_instance
+        private_factory = partial(icu.Transliterator.createFromRules, name, rules, icu_direction)
+        return cls._wrap(icu_trans, name, direction, private_factory)
 
     @property
     def transform_id(self) -> str:
@@ -167,39 +380,29 @@ class Transliterator:
             return self._transform_id
 
     @property
-    def source_set(self) -> set[str] | None:
-        """The set of characters that this transliterator will transform."""
-        try:
-            # PyICU transliterators may have getSourceSet method
-            uset = self._transliterator.getSourceSet()
-            if uset:
-                # Convert UnicodeSet to Python set
-                return {uset.charAt(i) for i in range(uset.size())}
-        except (AttributeError, Exception):
-            pass
-        return None
+    def source_set(self) -> AbstractSet[str] | None:
+        """The set of characters that this transliterator will transform.
+
+        Returned as a read-only set view backed by ICU, or None if empty.
+        """
+        uset = self._transliterator.getSourceSet()
+        return _UnicodeSetView(uset) if uset else None
 
     @property
-    def target_set(self) -> set[str] | None:
-        """The set of characters that this transliterator can produce."""
-        try:
-            # PyICU transliterators may have getTargetSet method
-            uset = self._transliterator.getTargetSet()
-            if uset:
-                # Convert UnicodeSet to Python set
-                return {uset.charAt(i) for i in range(uset.size())}
-        except (AttributeError, Exception):
-            pass
-        return None
+    def target_set(self) -> AbstractSet[str] | None:
+        """The set of characters that this transliterator can produce.
+
+        Returned as a read-only set view backed by ICU, or None if empty.
+        """
+        uset = self._transliterator.getTargetSet()
+        return _UnicodeSetView(uset) if uset else None
 
     def has_inverse(self) -> bool:
-        """Check if this transliterator has an inverse transform."""
-        try:
-            # Try to create inverse - if it succeeds, inverse exists
-            self._transliterator.createInverse()
-            return True
-        except Exception:
-            return False
+        """Check if this transliterator has an inverse transform.
+
+        The inverse is built once and reused by a later inverse() call.
+        """
+        return self._get_inverse() is not None
 
     def get_inverse(self) -> Transliterator:
         """Get the inverse transliterator.
@@ -219,8 +422,8 @@ class Transliterator:
 def transliterate(text: str, transform_id: str, direction: str = "forward", filter_fn=None) -> str:
     """Apply transliteration transform.
 
-    This is a convenience function that creates a temporary transliterator
-    for one-off transformations.
+    This is a convenience function for one-off transformations. The
+    underlying ICU transliterator is cached across calls.
 
     Args:
         text: Input text to transform.
@@ -237,16 +440,27 @@ def transliterate(text: str, transform_id: str, direction: str = "forward", filt
         >>> transliterate('北京', 'Han-Latin')
         'běi jīng'
     """
+    if filter_fn is None:
+        # Reuse a cached ICU transliterator rather than building one per call
+        icu_direction = _get_icu_direction(direction)
+        try:
+            icu_trans = _get_cached_transliterator(_canonical_transform_id(transform_id), icu_direction)
+        except icu.ICUError as e:
+            msg = f"Failed to create transliterator for '{transform_id}': {e}"
+            raise ConfigurationError(msg) from e
+        if text.isascii():
+            ascii_transform = _get_ascii_transform(icu_trans)
+            if ascii_transform is not None:
+                return ascii_transform(text)
+        return icu_trans.transliterate(text)
+
     trans = Transliterator(transform_id, direction)
     return trans.transliterate(text, filter_fn=filter_fn)
 
 
-def get_available_transforms() -> list[str]:
-    """Return list of available transform IDs.
-
-    Returns:
-        List of available ICU transform identifiers.
-    """
+@lru_cache(maxsize=1)
+def _available_transform_ids() -> tuple[str, ...]:
+    """Enumerate ICU transform IDs once and keep them sorted."""
     # Get available IDs from ICU
     # ICU returns an Enumeration, convert to list
     ids = []
@@ -263,7 +477,34 @@ def get_available_transforms() -> list[str]:
         except StopIteration:
             break
 
-    return sorted(ids)
+    return tuple(sorted(ids))
+
+
+def get_available_transforms() -> list[str]:
+    """Return list of available transform IDs.
+
+    The ICU enumeration is walked on the first call only.
+
+    Returns:
+        List of available ICU transform identifiers.
+    """
+    return list(_available_transform_ids())
+
+
+@lru_cache(maxsize=1)
+def _transform_alias_groups() -> dict[str, tuple[str, ...]]:
+    """Group available transform IDs by the rules they compile to.
+
+    Built in one sweep over all IDs on first use.
+    """
+    groups: dict[str, list[str]] = {}
+    for transform_id in _available_transform_ids():
+        try:
+            rules = icu.Transliterator.createInstance(transform_id).toRules(True)
+        except icu.ICUError:
+            continue
+        groups.setdefault(rules, []).append(transform_id)
+    return {rules: tuple(ids) for rules, ids in groups.items()}
 
 
 def list_transform_aliases(transform_id: str) -> list[str]:
@@ -274,28 +515,26 @@ def list_transform_aliases(transform_id: str) -> list[str]:
 
     Returns:
         List of alias IDs that map to the same transform.
+
+    Raises:
+        ConfigurationError: If the transform ID is invalid.
     """
+    # ICU doesn't directly expose aliases, but IDs naming the same
+    # transform compile to identical rules
     try:
-        # ICU doesn't directly expose aliases, but we can check
-        # which IDs create equivalent transliterators
-        aliases = []
-        base_trans = icu.Transliterator.createInstance(transform_id)
-
-        for test_id in get_available_transforms():
-            if test_id != transform_id:
-                try:
-                    test_trans = icu.Transliterator.createInstance(test_id)
-                    # Compare by ID (not perfect but reasonable)
-                    if test_trans.getID() == base_trans.getID():
-                        aliases.append(test_id)
-                except Exception:
-                    pass
-
-        return aliases
-    except Exception as e:
+        rules = icu.Transliterator.createInstance(transform_id).toRules(True)
+    except icu.ICUError as e:
         msg = f"Failed to get aliases for '{transform_id}': {e}"
         raise ConfigurationError(msg) from e
 
+    return [alias for alias in _transform_alias_groups().get(rules, ()) if alias != transform_id]
+
+
+@lru_cache(maxsize=256)
+def _find_transform_ids(keyword_lower: str) -> tuple[str, ...]:
+    """Return transform IDs containing a lowercase keyword."""
+    return tuple(t for t in _available_transform_ids() if keyword_lower in t.lower())
+
 
 def find_transforms(keyword: str) -> list[str]:
     """Find transform IDs containing a keyword.
@@ -314,6 +553,4 @@ def find_transforms(keyword: str) -> list[str]:
         >>> find_transforms('arabic')
         ['Any-Arabic', 'Arabic-Latin', 'Latin-Arabic', ...]
     """
-    keyword_lower = keyword.lower()
-    transforms = get_available_transforms()
-    return [t for t in transforms if keyword_lower in t.lower()]
+    return list(_find_transform_ids(keyword.lower()))
@@ -85,6 +85,44 @@ class TestCollator:
         assert isinstance(key_a, bytes)
         assert isinstance(key_b, bytes)
 
+    def test_trimmed_sort_key(self):
+        """Test sort keys trimmed to a lower strength."""
+        collator = uicu.Collator("fr-FR")
+        primary = uicu.Collator("fr-FR", strength="primary")
+        secondary = uicu.Collator("fr-FR", strength="secondary")
+        words = ["côte", "Cote", "coté", "cote", "Côte"]
+
+        for word in words:
+            assert collator.key(word, max_strength="primary") == primary.key(word)
+            assert collator.key(word, max_strength="secondary") == secondary.key(word)
+            assert collator.key(word, max_strength="identical") == collator.key(word)
+
+        # The optional case level is kept at every strength, as ICU does
+        with_case = uicu.Collator("en-US", strength="quaternary", case_level=True)
+        for strength in ("primary", "secondary", "tertiary"):
+            target = uicu.Collator("en-US", strength=strength, case_level=True)
+            for word in [*words, "Abc"]:
+                assert with_case.key(word, max_strength=strength) == target.key(word)
+
+        with pytest.raises(uicu.ConfigurationError):
+            collator.key("cote", max_strength="invalid")
+
+    def test_bulk_keys(self):
+        """Test generating sort keys for many strings at once."""
+        collator = uicu.Collator("en-US")
+        words = ["banana", "apple", "Cherry"]
+        assert collator.keys(words) == [collator.key(w) for w in words]
+        assert collator.keys(iter(words)) == collator.keys(words)
+
+    def test_sort_with_keys(self):
+        """Test sorting with the sort keys returned alongside."""
+        collator = uicu.Collator("fr-FR")
+        words = ["côte", "cote", "coté", "café"]
+
+        pairs = collator.sort_with_keys(words)
+        assert [s for _, s in pairs] == collator.sort(words)
+        assert [k for k, _ in pairs] == [collator.key(s) for s in collator.sort(words)]
+
     def test_callable_interface(self):
         """Test using collator as key function."""
         collator = uicu.Collator("en-US")
@@ -161,3 +199,29 @@ class TestConvenienceFunctions:
 
         # With options
         assert uicu.compare("A", "a", "en-US", strength="primary") == 0
+
+    def test_cached_collator_options(self):
+        """Test that cached collators are kept apart by their options."""
+        assert uicu.compare("A", "a", "en-US", strength="primary") == 0
+        assert uicu.compare("A", "a", "en-US") != 0
+        assert uicu.sort(["10", "9"], "en-US", numeric=True) == ["9", "10"]
+        assert uicu.sort(["10", "9"], "en-US") == ["10", "9"]
+
+        with pytest.raises(uicu.ConfigurationError):
+            uicu.compare("a", "b", "en-US", strength="invalid")
+
+        # Option order does not matter and unhashable values are rejected cleanly
+        from uicu.collate import _get_collator
+
+        assert _get_collator("en-US", {"strength": "primary", "numeric": True}) is _get_collator(
+            "en-US", {"numeric": True, "strength": "primary"}
+        )
+        with pytest.raises(uicu.ConfigurationError):
+            uicu.sort(["b", "a"], "en-US", case_first=["upper"])
+
+    def test_cached_collator_locale_keywords(self):
+        """Test that locale keywords are part of the cached collator's identity."""
+        words = ["Müller", "Muller", "Mueller", "Mzz"]
+        assert uicu.sort(words, uicu.Locale("de-DE")) == ["Mueller", "Muller", "Müller", "Mzz"]
+        phonebook = uicu.Locale("de-DE-u-co-phonebk")
+        assert uicu.sort(words, phonebook) == ["Mueller", "Müller", "Muller", "Mzz"]
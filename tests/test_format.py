@@ -2,8 +2,9 @@
 # this_file: tests/test_format.py
 """Tests for formatting module."""
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
+import icu
 import pytest
 
 import uicu
@@ -74,6 +75,16 @@ class TestDateTimeFormatter:
         result = formatter.format(dt)
         assert result == "January 25, 2025"
 
+    def test_millisecond_precision(self):
+        """Test that UTC datetimes keep their milliseconds."""
+        formatter = uicu.DateTimeFormatter("en-US", pattern="yyyy-MM-dd HH:mm:ss.SSS")
+
+        dt = datetime(2025, 1, 25, 15, 30, 45, 123456, tzinfo=timezone.utc)
+        assert formatter.format(dt) == "2025-01-25 15:30:45.123"
+
+        dt = datetime(1969, 12, 31, 23, 59, 59, 999999, tzinfo=timezone.utc)
+        assert formatter.format(dt) == "1969-12-31 23:59:59.999"
+
     def test_skeleton_pattern(self):
         """Test skeleton pattern formatting."""
         dt = datetime(2025, 1, 25, 15, 30, 45, tzinfo=timezone.utc)
@@ -86,6 +97,72 @@ class TestDateTimeFormatter:
         assert "2025" in result
         assert "3:30" in result or "15:30" in result
 
+    def test_tzinfo_reuse(self):
+        """Test that resolved timezones are reused without leaking across names."""
+        cet = timezone(timedelta(hours=1), "CET")
+        summer = datetime(2025, 7, 1, 12, 0, tzinfo=timezone.utc)
+        winter = datetime(2025, 1, 1, 12, 0, tzinfo=cet)
+
+        formatter = uicu.DateTimeFormatter("en-US", date_style="none", time_style="full")
+        first = formatter.format(winter)
+        assert formatter.format(winter) == first
+        fresh = uicu.DateTimeFormatter("en-US", date_style="none", time_style="full")
+        assert formatter.format(summer) == fresh.format(summer)
+
+    def test_tzinfo_same_offset(self):
+        """Test zones sharing an offset are resolved by name, not offset."""
+        paris = datetime(2025, 7, 1, 12, 0, tzinfo=timezone(timedelta(hours=1), "Europe/Paris"))
+        lagos = datetime(2025, 7, 1, 12, 0, tzinfo=timezone(timedelta(hours=1), "Africa/Lagos"))
+        london = datetime(2025, 7, 1, 12, 0, tzinfo=timezone(timedelta(0), "Europe/London"))
+        utc = datetime(2025, 7, 1, 12, 0, tzinfo=timezone.utc)
+
+        def fresh_format(dt):
+            return uicu.DateTimeFormatter("en-US", date_style="none", time_style="full").format(dt)
+
+        formatter = uicu.DateTimeFormatter("en-US", date_style="none", time_style="full")
+        for dt in (paris, lagos, utc, london):
+            assert formatter.format(dt) == fresh_format(dt)
+        assert formatter.format(paris) != formatter.format(lagos)
+        assert formatter.format(utc) != formatter.format(london)
+
+    def test_format_many(self):
+        """Test batch formatting matches per-item formatting."""
+        dts = [
+            datetime(2025, 1, 25, 15, 30, 45),  # Naive values take the wall-clock path # noqa: DTZ001
+            datetime(2025, 7, 1, 12, 0, 0, 999999),  # noqa: DTZ001
+            datetime(2025, 3, 30, 2, 30, tzinfo=timezone.utc),
+            datetime(1999, 12, 31, 23, 59, 59),  # noqa: DTZ001
+        ]
+
+        for tz in (None, "UTC"):
+            batch = uicu.DateTimeFormatter("en-US", date_style="long", time_style="long")
+            single = uicu.DateTimeFormatter("en-US", date_style="long", time_style="long")
+            assert batch.format_many(dts, tz=tz) == [single.format(dt, tz=tz) for dt in dts]
+
+        assert uicu.DateTimeFormatter("en-US").format_many([]) == []
+
+    def test_format_timestamps(self):
+        """Test batch formatting of POSIX timestamps."""
+        dts = [
+            datetime(2025, 1, 25, 15, 30, 45, tzinfo=timezone.utc),
+            datetime(1969, 7, 20, 20, 17, 40, 500000, tzinfo=timezone.utc),
+        ]
+        formatter = uicu.DateTimeFormatter("en-US", pattern="yyyy-MM-dd HH:mm:ss.SSS", tz="UTC")
+
+        assert formatter.format_timestamps(dt.timestamp() for dt in dts) == formatter.format_many(dts)
+        assert formatter.format_timestamps([0]) == ["1970-01-01 00:00:00.000"]
+
+    def test_format_timestamps_datetime64(self):
+        """Test batch formatting of a NumPy datetime64 array."""
+        np = pytest.importorskip("numpy")
+        formatter = uicu.DateTimeFormatter("en-US", pattern="yyyy-MM-dd HH:mm:ss.SSS", tz="UTC")
+        values = np.array(["1969-07-20T20:17:40.5", "2025-01-25T15:30:45.123456"], dtype="datetime64[us]")
+
+        assert formatter.format_timestamps(values) == [
+            "1969-07-20 20:17:40.500",
+            "2025-01-25 15:30:45.123",
+        ]
+
     def test_format_range(self):
         """Test date range formatting."""
         formatter = uicu.DateTimeFormatter("en-US", date_style="medium", time_style="none")
@@ -101,6 +178,43 @@ class TestDateTimeFormatter:
         assert "5" in result
         # Should use hyphen
         assert "-" in result
+        # Shared fields are collapsed by ICU's interval formatter
+        assert result.count("2025") == 1
+
+        # An explicit pattern is applied to each endpoint as written
+        iso = uicu.DateTimeFormatter("en-US", pattern="yyyy-MM-dd")
+        assert iso.format_range(start, end) == "2025-01-03 - 2025-01-05"
+
+        # Only the separator between the endpoints is normalized
+        icelandic = uicu.DateTimeFormatter("is-IS", skeleton="Hmv", tz="UTC")
+        result = icelandic.format_range(start, end)
+        assert result.count("GMT \u2013 00:00") == 2
+        assert result.count(" - ") == 1
+
+        # Separator positions count UTF-16 code units
+        chakma = uicu.DateTimeFormatter("ccp", skeleton="yMMMd", tz="UTC")
+        assert chakma.format_range(start, end).split("-")[0] == "\U00011139"
+
+    def test_format_range_timezones(self):
+        """Test ranges are shown in the zone format() uses, not ICU's default."""
+        start = datetime(2025, 1, 3, 9, 0, tzinfo=timezone.utc)
+        end = datetime(2025, 1, 3, 10, 0, tzinfo=timezone.utc)
+
+        default_zone = icu.TimeZone.createDefault()
+        icu.TimeZone.setDefault(icu.TimeZone.createTimeZone("America/New_York"))
+        try:
+            formatter = uicu.DateTimeFormatter("en-US", skeleton="Hmz")
+            assert formatter.format_range(start, end) == "09:00 - 10:00 GMT"
+
+            # Naive endpoints are read in the default zone and shown in the formatter's
+            tokyo = uicu.DateTimeFormatter("en-US", skeleton="Hm", tz="Asia/Tokyo")
+            naive_start = start.replace(tzinfo=None)
+            assert tokyo.format(naive_start) == "23:00"
+            result = tokyo.format_range(naive_start, end.replace(tzinfo=None))
+            assert "23:00" in result
+            assert "00:00" in result
+        finally:
+            icu.TimeZone.setDefault(default_zone)
 
     def test_locale_factory(self):
         """Test creating formatter from locale."""
@@ -122,9 +236,29 @@ class TestDateTimeFormatter:
         with pytest.raises(OperationError):
             uicu.DateTimeFormatter("en-US", time_style="invalid")
 
+    def test_parsing(self):
+        """Test parsing round-trips formatted values."""
+        formatter = uicu.DateTimeFormatter("en-US", pattern="yyyy-MM-dd HH:mm:ss.SSS")
+        dt = datetime(2025, 1, 25, 15, 30, 45, 123000)  # parse() returns naive datetimes # noqa: DTZ001
+        assert formatter.parse(formatter.format(dt)) == dt
+
+        styled = uicu.DateTimeFormatter("en-US", date_style="long", time_style="none")
+        assert styled.parse("January 25, 2025") == datetime(2025, 1, 25)  # noqa: DTZ001
+
+        texts = ["2025-01-25 15:30:45.000", "1999-12-31 23:59:59.999"]
+        assert formatter.parse_many(texts) == [formatter.parse(text) for text in texts]
+        assert formatter.parse_many([]) == []
+
     def test_parsing_errors(self):
         """Test parsing error handling."""
-        pytest.skip("Parse method has been removed for v1.0 MVP")
+        formatter = uicu.DateTimeFormatter("en-US", pattern="yyyy-MM-dd")
+
+        with pytest.raises(OperationError):
+            formatter.parse("not a date")
+        with pytest.raises(OperationError):
+            formatter.parse("2025-01-25 trailing")
+        with pytest.raises(OperationError):
+            formatter.parse_many(["2025-01-25", "garbage"])
 
     def test_repr(self):
         """Test string representation."""
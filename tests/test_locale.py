@@ -2,6 +2,8 @@
 # this_file: tests/test_locale.py
 """Tests for locale module."""
 
+import gc
+
 import pytest
 
 import uicu
@@ -63,6 +65,24 @@ class TestLocale:
         assert loc1 != loc3
         assert str(loc1) == "en_US"
 
+    def test_locale_interning(self):
+        """Test that equal locales share one instance."""
+        assert uicu.Locale("en-US") is uicu.Locale("en_US")
+        assert uicu.Locale("en-US") is not uicu.Locale("en-GB")
+        # Keywords are part of the identity
+        assert uicu.Locale("de-DE-u-co-phonebk") is not uicu.Locale("de-DE")
+
+    def test_locale_intern_is_weak(self):
+        """Test that interned locales are released once unreferenced."""
+        from uicu.locale import _LOCALE_INTERN
+
+        loc = uicu.Locale("qaa-Zzzz-AQ")
+        name = loc._icu_locale.getName()
+        assert _LOCALE_INTERN.get(name) is loc
+        del loc
+        gc.collect()
+        assert name not in _LOCALE_INTERN
+
     def test_factory_methods(self):
         """Test factory methods for creating services."""
         loc = uicu.Locale("fr-FR")
@@ -91,6 +111,13 @@ class TestLocaleConvenienceFunctions:
         assert "fr-FR" in locales or "fr_FR" in locales
         assert "ja-JP" in locales or "ja_JP" in locales
 
+    def test_is_locale_available(self):
+        """Test checking locale availability."""
+        assert uicu.is_locale_available("en-US")
+        assert uicu.is_locale_available("fr_FR")
+        assert not uicu.is_locale_available("xx-XX")
+        assert all(uicu.is_locale_available(tag) for tag in uicu.get_available_locales())
+
     def test_get_default_locale(self):
         """Test getting system default locale."""
         default = uicu.get_default_locale()
@@ -16,6 +16,12 @@ class TestGraphemeSegmentation:
         graphemes = list(uicu.graphemes("hello"))
         assert graphemes == ["h", "e", "l", "l", "o"]
 
+        # CR LF is a single cluster even in ASCII text
+        assert list(uicu.graphemes("a\r\nb\n\r")) == ["a", "\r\n", "b", "\n", "\r"]
+        segmenter = uicu.GraphemeSegmenter()
+        assert segmenter.segment_list("a\r\nb") == ["a", "\r\n", "b"]
+        assert list(segmenter.boundaries("ab\tc")) == [0, 1, 2, 3, 4]
+
         # With combining marks
         text = "café"  # e with acute accent
         graphemes = list(uicu.graphemes(text))
@@ -68,6 +74,14 @@ class TestWordSegmentation:
         assert "," not in words
         assert "!" not in words
 
+    def test_contains_word(self):
+        """Test whole-word membership checks."""
+        assert uicu.contains_word("Hello, world!", "world")
+        assert not uicu.contains_word("concatenate", "cat")
+        assert not uicu.contains_word("Hello, world!", "planet")
+        assert not uicu.contains_word("Hello", "")
+        assert uicu.contains_word("สวัสดีครับ", "ครับ", locale="th-TH")
+
     def test_contractions(self):
         """Test word segmentation with contractions."""
         # English contractions
@@ -113,6 +127,53 @@ class TestWordSegmentation:
         assert len(text) in boundaries  # End
 
 
+class TestPreparedText:
+    """Test reusing prepared text across segmenters."""
+
+    def test_segment_prepared(self):
+        """Test that prepared text segments like plain text."""
+        text = "Hi 👋🏽 there. Bye!"
+        graphemes = uicu.GraphemeSegmenter()
+        words = uicu.WordSegmenter(skip_whitespace=True)
+        sentences = uicu.SentenceSegmenter()
+
+        prepared = graphemes.prepare(text)
+        assert list(graphemes.segment_prepared(prepared)) == list(graphemes.segment(text))
+        assert list(words.segment_prepared(prepared)) == list(words.segment(text))
+        assert list(sentences.segment_prepared(prepared)) == ["Hi 👋🏽 there. ", "Bye!"]
+
+    def test_segment_without_prepare(self, monkeypatch):
+        """Test that segment() does not go through prepare()."""
+
+        def fail(*_args):
+            raise AssertionError
+
+        monkeypatch.setattr(uicu.WordSegmenter, "prepare", fail)
+        words = uicu.WordSegmenter(skip_whitespace=True)
+        assert list(words.segment("Hello, world!")) == ["Hello", ",", "world", "!"]
+
+    def test_segment_list(self):
+        """Test that segment_list matches segment for BMP and astral text."""
+        graphemes = uicu.GraphemeSegmenter()
+        words = uicu.WordSegmenter(skip_whitespace=True)
+        for text in ("", "Hello, world!", "Hi 👋🏽 there. Bye!"):
+            assert graphemes.segment_list(text) == list(graphemes.segment(text))
+            assert words.segment_list(text) == list(words.segment(text))
+
+    def test_scan(self):
+        """Test that scan returns segments and boundaries together."""
+        graphemes = uicu.GraphemeSegmenter()
+        words = uicu.WordSegmenter(skip_whitespace=True)
+        for text in ("", "Hello, world!", "Hi 👋🏽 there. Bye!"):
+            segments, boundaries = graphemes.scan(text)
+            assert segments == graphemes.segment_list(text)
+            assert boundaries == graphemes.boundaries(text)
+
+            segments, boundaries = words.scan(text)
+            assert segments == words.segment_list(text)
+            assert boundaries == words.boundaries(text)
+
+
 class TestSentenceSegmentation:
     """Test sentence boundary segmentation."""
 
@@ -176,6 +237,49 @@ class TestLineBreaking:
         for start in word_starts:
             assert start in breaks or start + 1 in breaks
 
+    def test_line_breaks_astral(self):
+        """Test that positions are Python indices, not UTF-16 offsets."""
+        text = "😀 abc 😀 def"
+        assert list(uicu.line_breaks(text)) == [2, 6, 8]
+
+        segmenter = uicu.LineSegmenter()
+        assert list(segmenter.boundaries(text)) == [0, 2, 6, 8, len(text)]
+        assert segmenter.boundary_set(text) == {0, 2, 6, 8, len(text)}
+
+    def test_boundary_membership(self):
+        """Test membership tests on boundaries."""
+        text = "word " * 200
+        boundaries = uicu.WordSegmenter().boundaries(text)
+
+        assert all(position in boundaries for position in range(0, len(text) + 1, 5))
+        assert 1 not in boundaries
+        assert -1 not in boundaries
+        assert len(text) + 1 not in boundaries
+        assert "0" not in boundaries
+
+
+class TestIteratorReuse:
+    """Test reuse of break iterators by the functional API."""
+
+    def test_interleaved_generators(self):
+        """Test that concurrently open generators do not share state."""
+        first = uicu.words("alpha beta gamma")
+        second = uicu.words("one two three")
+        assert list(zip(first, second, strict=True)) == [("alpha", "one"), ("beta", "two"), ("gamma", "three")]
+
+    def test_repeated_calls(self):
+        """Test that a reused iterator starts fresh for new text."""
+        assert list(uicu.sentences("One. Two.")) == ["One. ", "Two."]
+        assert list(uicu.sentences("Three.")) == ["Three."]
+
+    def test_pool_is_bounded(self):
+        """Test that a thread keeps a bounded number of idle iterators."""
+        from uicu.segment import _MAX_POOLED_ITERATORS, _get_iterator_pool
+
+        for locale in uicu.get_available_locales()[: _MAX_POOLED_ITERATORS + 8]:
+            assert list(uicu.words("one two", locale=locale)) == ["one", "two"]
+        assert len(_get_iterator_pool()) == _MAX_POOLED_ITERATORS
+
 
 class TestSegmentationErrors:
     """Test error handling in segmentation."""
@@ -185,6 +289,11 @@ class TestSegmentationErrors:
         assert list(uicu.graphemes("")) == []
         assert list(uicu.words("")) == []
         assert list(uicu.sentences("")) == []
+        assert list(uicu.line_breaks("")) == []
+
+        segmenter = uicu.GraphemeSegmenter()
+        assert list(segmenter.segment("")) == []
+        assert list(segmenter.boundaries("")) == [0]
 
     def test_invalid_locale(self):
         """Test invalid locale handling."""
@@ -2,6 +2,10 @@
 # this_file: tests/test_translit.py
 """Tests for transliteration module."""
 
+import sys
+from collections.abc import Set as AbstractSet
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 import uicu
@@ -43,6 +47,11 @@ class TestTransliterator:
         nfc = uicu.Transliterator("NFC")
         assert len(nfc.transliterate(decomposed)) == 1
 
+        # ASCII input passes through unchanged, including in reverse
+        assert nfc.transliterate("plain text") == "plain text"
+        assert uicu.Transliterator("NFC", direction="reverse").transliterate("é") == decomposed
+        assert nfd.transliterate_many(["abc", composed]) == ["abc", decomposed]
+
     def test_case_transforms(self):
         """Test case transformation."""
         # Upper case
@@ -57,6 +66,11 @@ class TestTransliterator:
         title = uicu.Transliterator("Title")
         assert title.transliterate("hello world") == "Hello World"
 
+        # ASCII and non-ASCII input agree with ICU's case rules
+        assert title.transliterate("don't stop") == "Don't Stop"
+        assert upper.transliterate_many(["abc", "straße"]) == ["ABC", "STRASSE"]
+        assert uicu.transliterate("Hello", "Upper", direction="reverse") == "hello"
+
     def test_invalid_transform(self):
         """Test error handling for invalid transforms."""
         with pytest.raises(uicu.ConfigurationError):
@@ -69,6 +83,19 @@ class TestTransliterator:
         result = trans.transliterate("Αθήνα")
         assert result == "athina" or result == "athena"
 
+        # Spacing around separators does not matter; the ID is kept as given
+        compact = uicu.Transliterator("Greek-Latin;Latin-ASCII;Lower")
+        assert compact.transliterate("Αθήνα") == result
+        assert compact.id == "Greek-Latin;Latin-ASCII;Lower"
+
+    def test_shared_transforms_filter_independently(self):
+        """Test a filter on one instance does not affect another with the same ID."""
+        first = uicu.Transliterator("Latin-ASCII")
+        second = uicu.Transliterator("Latin-ASCII")
+        assert first.transliterate("Éé", filter_fn=str.isupper) == "Eé"
+        assert second.transliterate("Éé") == "Ee"
+        assert first.transliterate("Éé") == "Ee"
+
     def test_inverse_transform(self):
         """Test inverse transforms."""
         trans = uicu.Transliterator("Katakana-Latin")
@@ -83,6 +110,17 @@ class TestTransliterator:
             # May not be exactly the same due to ambiguities
             assert len(back) > 0
 
+    def test_inverse_is_reused(self):
+        """Test the inverse is built once and shared with has_inverse()."""
+        trans = uicu.Transliterator("Latin-ASCII")
+        assert trans.has_inverse()
+        assert trans.inverse() is trans.inverse()
+
+        no_inverse = uicu.Transliterator("Han-Latin")
+        assert not no_inverse.has_inverse()
+        with pytest.raises(uicu.ConfigurationError):
+            no_inverse.inverse()
+
     def test_filter_function(self):
         """Test filter function for selective transliteration."""
         # Only transliterate uppercase letters
@@ -96,14 +134,54 @@ class TestTransliterator:
         # The behavior depends on implementation
         assert "a" in result  # Lowercase unchanged
 
+        # Only the accepted characters change, and the filter does not persist
+        assert trans.transliterate("CaFé ÉCOLE", filter_fn=uppercase_filter) == "CaFé ECOLE"
+        assert trans.transliterate("CaFé ÉCOLE") == "CaFe ECOLE"
+
+    def test_concurrent_filtered_calls(self):
+        """Test filtered and unfiltered calls on one instance from many threads."""
+        text = "ÉCOLE é"
+        trans = uicu.Transliterator.from_rules("Accents", ":: Latin-ASCII ;")
+
+        def work(index):
+            if index % 2:
+                return trans.transliterate(text, filter_fn=str.isupper)
+            return trans.transliterate(text)
+
+        # Switch threads often so that unsynchronized filter swaps would interleave
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(work, range(2000)))
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        assert set(results[0::2]) == {"ECOLE e"}
+        assert set(results[1::2]) == {"ECOLE é"}
+
     def test_transliterator_properties(self):
         """Test transliterator properties."""
         trans = uicu.Transliterator("Latin-ASCII")
 
         assert trans.id == "Latin-ASCII"
         assert len(trans.display_name) > 0
-        assert isinstance(trans.source_set, set | type(None))
-        assert isinstance(trans.target_set, set | type(None))
+        assert isinstance(trans.source_set, AbstractSet | type(None))
+        assert isinstance(trans.target_set, AbstractSet | type(None))
+
+    def test_source_and_target_sets(self):
+        """Test source/target sets are usable as sets of characters."""
+        trans = uicu.Transliterator("Greek-Latin")
+        source = trans.source_set
+        target = trans.target_set
+
+        alpha = "\u03b1"
+        assert alpha in source
+        assert "a" not in source
+        assert ord(alpha) not in source
+        assert "a" in target
+        assert len(source) == len(list(source))
+        assert {alpha, "a"} & source == {alpha}
 
 
 class TestConvenienceFunctions:
@@ -132,6 +210,17 @@ class TestConvenienceFunctions:
         assert any("Upper" in t for t in transforms)
         assert any("Lower" in t for t in transforms)
 
+    def test_list_transform_aliases(self):
+        """Test finding alias IDs for a transform."""
+        from uicu.translit import list_transform_aliases
+
+        aliases = list_transform_aliases("Greek-Latin")
+        assert "Grek-Latn" in aliases
+        assert "Greek-Latin" not in aliases
+
+        with pytest.raises(uicu.ConfigurationError):
+            list_transform_aliases("Invalid-Transform")
+
     def test_script_detection(self):
         """Test convenience functions for script operations."""
         # Detect primary script
@@ -139,29 +228,53 @@ class TestConvenienceFunctions:
         assert uicu.detect_script("Привет") == "Cyrl"
         assert uicu.detect_script("你好") == "Hani"
 
+        # Repeated characters count towards the plurality
+        assert uicu.detect_script("ab Привет Привет") == "Cyrl"
+
         # Mixed scripts
         mixed = uicu.detect_script("Hello世界")
         assert mixed in ["Latn", "Hani", "Mixed", None]  # Depends on implementation
 
 
+# Accented words and their Latin-ASCII forms
+REMOVE_ACCENTS_CASES = [
+    ("café", "cafe"),
+    ("naïve", "naive"),
+    ("résumé", "resume"),
+    ("piñata", "pinata"),
+    ("Zürich", "Zurich"),
+]
+
+
 class TestSpecialTransforms:
     """Test special-purpose transforms."""
 
-    def test_remove_accents(self):
-        """Test accent removal transform."""
-        # Using Latin-ASCII for accent removal
-        trans = uicu.Transliterator("Latin-ASCII")
+    @pytest.fixture(scope="class")
+    def latin_ascii(self):
+        """Latin-ASCII transliterator shared by the accent removal tests."""
+        return uicu.Transliterator("Latin-ASCII")
 
-        test_cases = [
-            ("café", "cafe"),
-            ("naïve", "naive"),
-            ("résumé", "resume"),
-            ("piñata", "pinata"),
-            ("Zürich", "Zurich"),
+    @pytest.mark.parametrize(("original", "expected"), REMOVE_ACCENTS_CASES)
+    def test_remove_accents(self, latin_ascii, original, expected):
+        """Test accent removal transform."""
+        assert latin_ascii.transliterate(original) == expected
+
+    def test_remove_accents_batch(self, latin_ascii):
+        """Test accent removal over a batch and on ASCII input."""
+        # The whole batch in one call
+        originals = [original for original, _ in REMOVE_ACCENTS_CASES]
+        assert latin_ascii.transliterate_many(originals) == [expected for _, expected in REMOVE_ACCENTS_CASES]
+        assert latin_ascii.transliterate_many(originals, filter_fn=str.isupper) == [
+            latin_ascii.transliterate(original, filter_fn=str.isupper) for original in originals
         ]
 
-        for original, expected in test_cases:
-            assert trans.transliterate(original) == expected
+        # ASCII input is returned as is; decomposed accents are still removed
+        assert latin_ascii.transliterate("plain text") == "plain text"
+        assert uicu.transliterate("cafe\u0301", "Latin-ASCII") == "cafe"
+
+        # A rule-based transliterator is never assumed to be a known transform
+        custom = uicu.Transliterator.from_rules("Latin-ASCII", "a > b;")
+        assert custom.transliterate("abc") == "bbc"
 
     def test_any_to_latin(self):
         """Test Any-Latin transform."""